@@ -0,0 +1,67 @@
+"""
+Phase 6 – Data Migration: read collections out of a Firestore JSON export.
+
+Exports can run to gigabytes, so when `ijson` is installed records are
+streamed one at a time (using its C backend where available) instead of
+loading the whole file. Without `ijson` the whole file is parsed at once,
+with `orjson` when it is installed and the stdlib `json` module otherwise.
+
+Both layouts written by export_firestore.py are supported:
+    {"exported_at": "...", "collections": {"users": [...], ...}}
+    {"users": [...], ...}
+"""
+
+import json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path: str):
+    """Parse the JSON file at `path` in one go."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FirestoreExport:
+    def __init__(self, path: str):
+        self.path = path
+        self._collections = None
+        self._prefix = ""
+        if ijson is None:
+            export = load_json(path)
+            self._collections = export.get("collections", export)
+            self.exported_at = export.get("exported_at", "unknown")
+        else:
+            self._prefix, self.exported_at = self._scan_layout()
+
+    def _scan_layout(self):
+        # Only reads up to the first collection key, not the whole file.
+        exported_at = "unknown"
+        with open(self.path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "exported_at" and event == "string":
+                    exported_at = value
+                elif prefix == "" and event == "map_key" and value != "exported_at":
+                    return ("collections." if value == "collections" else ""), exported_at
+        return "", exported_at
+
+    def records(self, key: str):
+        """Yield the records of collection `key` one at a time."""
+        if self._collections is not None:
+            yield from self._collections.get(key) or []
+            return
+        with open(self.path, "rb") as f:
+            # use_float keeps numbers JSON-serialisable (ijson defaults to Decimal).
+            yield from ijson.items(f, f"{self._prefix}{key}.item", use_float=True)
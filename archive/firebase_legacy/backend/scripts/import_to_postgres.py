@@ -6,7 +6,7 @@ Usage (from the backend/ directory with venv active):
     DJANGO_SETTINGS_MODULE=tuutta_backend.settings.development \\
         python scripts/import_to_postgres.py \\
         --input firestore_export.json \\
-        [--dry-run]
+        [--dry-run] [--workers 4]
 
 Run after:
     python manage.py migrate
@@ -14,13 +14,24 @@ Run after:
 Options:
     --input    Path to the JSON file produced by export_firestore.py
     --dry-run  Validate and count records without writing to the database
+    --workers  Processes per import stage (1 = sequential, default 4); always
+               sequential on databases other than PostgreSQL
 """
 
 import argparse
-import json
 import os
 import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+
+from export_reader import FirestoreExport
+
+try:
+    from ciso8601 import parse_datetime as parse_iso
+except ImportError:
+    parse_iso = datetime.fromisoformat  # accepts a trailing "Z" on Python 3.11+
 
 
 # ---------------------------------------------------------------------------
@@ -33,7 +44,16 @@ def bootstrap_django():
     # Ensure the backend/ directory is on the path when run from backend/
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     import django
+    from django.conf import settings
+    from django.db import connection
+
     django.setup()
+    # Settings are read at connect time, so this applies before the first query.
+    db = settings.DATABASES["default"]
+    db["CONN_MAX_AGE"] = None  # one connection for the life of the process
+    if "postgresql" in db["ENGINE"]:
+        db.setdefault("OPTIONS", {})["application_name"] = "firestore_import"
+    connection.ensure_connection()
 
 
 # ---------------------------------------------------------------------------
@@ -46,11 +66,249 @@ def parse_dt(value):
     if isinstance(value, datetime):
         return value
     try:
-        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        return parse_iso(value if isinstance(value, str) else str(value))
     except (ValueError, TypeError):
         return None
 
 
+def parse_uuid(value):
+    """Parse a UUID string, returning None on failure."""
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def pick(item: dict, *keys, default=""):
+    """Return the first truthy value among `keys` in `item` (camelCase/snake_case aliases)."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return default
+
+
+BATCH_SIZE = 1000
+
+
+def batched(iterable, size=BATCH_SIZE):
+    """Yield lists of up to `size` items from `iterable`."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def upsert(model, objs, unique_fields, update_fields):
+    """
+    Write `objs` in batches as INSERT ... ON CONFLICT (`unique_fields`) DO UPDATE.
+
+    Stands in for per-row update_or_create with one statement per batch. A
+    single ON CONFLICT statement may not touch a row twice, so repeated keys
+    in a batch are collapsed first (last wins, as successive update_or_create
+    calls would). auto_now columns are refreshed on update. Bulk writes skip
+    model signals, so no webhooks/audit entries fire for historical data.
+    Returns the number of rows written.
+    """
+    key_fields = [model._meta.get_field(name) for name in unique_fields]
+    auto_now = [f.name for f in model._meta.concrete_fields if getattr(f, "auto_now", False)]
+    fields = list(update_fields) + auto_now
+
+    count = 0
+    for batch in batched(objs):
+        by_key = {
+            tuple(f.to_python(getattr(obj, f.attname)) for f in key_fields): obj
+            for obj in batch
+        }
+        model.objects.bulk_create(
+            list(by_key.values()),
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=fields,
+        )
+        count += len(by_key)
+
+    return count
+
+
+def copy_upsert(model, objs, unique_fields, update_fields):
+    """
+    PostgreSQL fast path for the largest collections.
+
+    Each batch is COPYed into a session-local staging table shaped like the
+    target, then merged with one INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+    COPY skips per-row parameter binding entirely. Other backends fall back to
+    `upsert`. Returns the number of rows written.
+    """
+    from django.db import connection, transaction
+
+    if connection.vendor != "postgresql":
+        return upsert(model, objs, unique_fields, update_fields)
+
+    qn = connection.ops.quote_name
+    meta = model._meta
+    fields = meta.concrete_fields
+    key_fields = [meta.get_field(name) for name in unique_fields]
+    update_columns = [meta.get_field(name).column for name in update_fields]
+    update_columns += [f.column for f in fields if getattr(f, "auto_now", False)]
+
+    table = qn(meta.db_table)
+    stage = qn(f"import_stage_{meta.db_table}")
+    columns = ", ".join(qn(f.column) for f in fields)
+    conflict = ", ".join(qn(f.column) for f in key_fields)
+    assignments = ", ".join(f"{qn(c)} = EXCLUDED.{qn(c)}" for c in update_columns)
+
+    count = 0
+    for batch in batched(objs):
+        # As in `upsert`: one ON CONFLICT statement may not touch a row twice.
+        by_key = {
+            tuple(f.to_python(getattr(obj, f.attname)) for f in key_fields): obj
+            for obj in batch
+        }
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {table})")
+            cursor.execute(f"TRUNCATE {stage}")
+            with cursor.copy(f"COPY {stage} ({columns}) FROM STDIN") as copy:
+                for obj in by_key.values():
+                    copy.write_row([
+                        f.get_db_prep_save(f.pre_save(obj, True), connection) for f in fields
+                    ])
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {stage} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {assignments}"
+            )
+        count += len(by_key)
+
+    return count
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(model):
+    return tuple((f.attname, f.get_default) for f in model._meta.concrete_fields)
+
+
+def build(model, values: dict):
+    """
+    Equivalent of `model(**values)` (keyed by attname) for the bulkiest loops.
+
+    Skips Model.__init__'s kwarg/descriptor handling and pre/post_init signals,
+    which the plain-column models built here don't use; missing fields get
+    their defaults as usual.
+    """
+    from django.db.models.base import ModelState
+
+    obj = model.__new__(model)
+    obj._state = ModelState()
+    attrs = obj.__dict__
+    for attname, get_default in _field_defaults(model):
+        attrs[attname] = values[attname] if attname in values else get_default()
+    return obj
+
+
+class BulkUpserter:
+    """
+    Buffer instances and `write` them `BATCH_SIZE` at a time, so an importer
+    streaming its collection never holds more than one batch in memory.
+
+    `on_flush(objs, extras)` runs after each batch lands, for dependent rows.
+    """
+
+    def __init__(self, model, unique_fields, update_fields, on_flush=None, write=upsert):
+        self.model = model
+        self.unique_fields = unique_fields
+        self.update_fields = update_fields
+        self.on_flush = on_flush
+        self.write = write
+        self.pending = []
+        self.extras = []
+
+    def add(self, obj, extra=None):
+        self.pending.append(obj)
+        self.extras.append(extra)
+        if len(self.pending) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        from django.db import transaction
+
+        if not self.pending:
+            return
+        # One transaction per batch: a single COMMIT covers the batch and its
+        # dependent rows, and a failure only rolls back this batch.
+        with transaction.atomic():
+            self.write(self.model, self.pending, self.unique_fields, self.update_fields)
+            if self.on_flush:
+                self.on_flush(self.pending, self.extras)
+        self.pending = []
+        self.extras = []
+
+
+# Largest tables; their secondary indexes are rebuilt once after the import
+# rather than maintained row by row.
+DEFERRED_INDEX_MODELS = ["enrollments.Enrollment", "progress.ProgressRecord", "courses.Lesson"]
+
+
+def drop_secondary_indexes() -> list:
+    """
+    Drop the non-unique indexes on DEFERRED_INDEX_MODELS' tables (PostgreSQL
+    only) and return their definitions for `restore_indexes`. Primary keys and
+    unique indexes stay, since the ON CONFLICT upserts rely on them.
+    """
+    from django.apps import apps
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        return []
+    tables = [apps.get_model(label)._meta.db_table for label in DEFERRED_INDEX_MODELS]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid) FROM pg_index "
+            "WHERE indrelid = ANY(%s::regclass[]) AND NOT indisunique AND NOT indisprimary",
+            [tables],
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+    return [definition for _, definition in indexes]
+
+
+def restore_indexes(definitions: list):
+    """Recreate the indexes dropped by `drop_secondary_indexes`."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        for definition in definitions:
+            cursor.execute(definition)
+
+
+# The id maps are cached so later importers reuse them; `import_collections`
+# clears them once a collection they cover has been (re)written.
+MAPPED_COLLECTIONS = {"users", "organizations", "courses"}
+
+
+@lru_cache(maxsize=None)
+def user_id_map() -> dict:
+    """Map firebase_uid -> User pk, so importers resolve users without a query per row."""
+    from apps.accounts.models import User
+
+    return dict(User.objects.filter(firebase_uid__isnull=False).values_list("firebase_uid", "pk"))
+
+
+@lru_cache(maxsize=None)
+def pk_map(model) -> dict:
+    """
+    Map UUID -> pk for every `model` row, for resolving ids carried in the export.
+
+    Look ids up through `parse_uuid()`, so any valid UUID spelling matches and
+    ids that are not UUIDs miss.
+    """
+    return {pk: pk for pk in model.objects.values_list("pk", flat=True)}
+
+
 def parse_args():
     parser = argparse.ArgumentParser(
         description="Import Firestore export JSON into PostgreSQL via Django ORM"
@@ -65,6 +323,12 @@ def parse_args():
         action="store_true",
         help="Validate input without writing to the database",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Processes per import stage; 1 imports sequentially (always on non-PostgreSQL databases)",
+    )
     return parser.parse_args()
 
 
@@ -72,49 +336,53 @@ def parse_args():
 # Importers (one per Firestore collection)
 # ---------------------------------------------------------------------------
 
-def import_users(data: list, dry_run: bool) -> int:
+def import_users(data, dry_run: bool) -> int:
     from apps.accounts.models import User
 
-    created = updated = skipped = 0
+    writer = BulkUpserter(
+        User,
+        unique_fields=["firebase_uid"],
+        update_fields=[
+            "email", "username", "display_name", "photo_url", "bio", "settings",
+            "subscription_tier", "stripe_customer_id", "last_active_at", "is_active",
+        ],
+    )
+    count = 0
     for item in data:
-        firebase_uid = item.get("_id") or item.get("uid")
+        firebase_uid = pick(item, "_id", "uid", default=None)
         email = item.get("email", "").strip()
         if not email:
-            skipped += 1
             continue
 
-        defaults = {
-            "email": email,
-            "username": email,  # Django requires username; use email as default
-            "display_name": item.get("displayName") or item.get("display_name", ""),
-            "photo_url": item.get("photoUrl") or item.get("photo_url", ""),
-            "bio": item.get("bio", ""),
-            "settings": item.get("settings") or {},
-            "subscription_tier": item.get("subscriptionTier") or item.get("subscription_tier", "free"),
-            "stripe_customer_id": item.get("stripeCustomerId") or item.get("stripe_customer_id", ""),
-            "last_active_at": parse_dt(item.get("lastActiveAt") or item.get("last_active_at")),
-            "is_active": item.get("isActive", True),
-        }
-
         if not dry_run:
-            _, was_created = User.objects.update_or_create(
+            writer.add(User(
                 firebase_uid=firebase_uid,
-                defaults=defaults,
-            )
-            if was_created:
-                created += 1
-            else:
-                updated += 1
-        else:
-            created += 1  # count as "would create" in dry-run
-
-    return created + updated
+                email=email,
+                username=email,  # Django requires username; use email as default
+                display_name=pick(item, "displayName", "display_name"),
+                photo_url=pick(item, "photoUrl", "photo_url"),
+                bio=item.get("bio", ""),
+                settings=item.get("settings") or {},
+                subscription_tier=pick(item, "subscriptionTier", "subscription_tier", default="free"),
+                stripe_customer_id=pick(item, "stripeCustomerId", "stripe_customer_id"),
+                last_active_at=parse_dt(pick(item, "lastActiveAt", "last_active_at", default=None)),
+                is_active=item.get("isActive", True),
+            ))
+        count += 1  # counts as "would create" in dry-run
+
+    writer.flush()
+    return count
 
 
-def import_organizations(data: list, dry_run: bool) -> int:
+def import_organizations(data, dry_run: bool) -> int:
     from django.utils.text import slugify
     from apps.organizations.models import Organization
 
+    writer = BulkUpserter(
+        Organization,
+        unique_fields=["id"],
+        update_fields=["name", "slug", "description", "logo_url", "plan", "settings", "is_active"],
+    )
     count = 0
     for item in data:
         org_id = item.get("_id")
@@ -124,62 +392,135 @@ def import_organizations(data: list, dry_run: bool) -> int:
         name = item.get("name", "Unnamed Org")
         slug = item.get("slug") or slugify(name) or f"org-{org_id[:8]}"
 
-        defaults = {
-            "name": name,
-            "slug": slug,
-            "description": item.get("description", ""),
-            "logo_url": item.get("logoUrl") or item.get("logo_url", ""),
-            "plan": item.get("plan", "free"),
-            "settings": item.get("settings") or {},
-            "is_active": item.get("isActive", True),
-        }
-
         if not dry_run:
-            Organization.objects.update_or_create(id=org_id, defaults=defaults)
+            writer.add(Organization(
+                id=org_id,
+                name=name,
+                slug=slug,
+                description=item.get("description", ""),
+                logo_url=pick(item, "logoUrl", "logo_url"),
+                plan=item.get("plan", "free"),
+                settings=item.get("settings") or {},
+                is_active=item.get("isActive", True),
+            ))
         count += 1
 
+    writer.flush()
     return count
 
 
-def import_org_members(data: list, dry_run: bool) -> int:
+def join_org_members(rows) -> int:
+    """
+    PostgreSQL path for `import_org_members`.
+
+    Each batch of raw (org_id, firebase_uid, role, job_title, status) rows is
+    COPYed into a staging table and resolved against users and organizations
+    with one INSERT ... SELECT ... JOIN, so neither id map is loaded into
+    Python. Rows whose user or organization is missing drop out of the join;
+    org ids that are not UUIDs cannot match an organization and are skipped
+    before staging.
+    Returns the number of rows written.
+    """
+    from django.db import connection, transaction
+
     from apps.accounts.models import User
     from apps.organizations.models import Organization, OrganizationMember
 
-    VALID_ROLES = {"learner", "instructor", "team_lead", "ld_manager", "org_admin", "super_admin"}
+    qn = connection.ops.quote_name
+    stage = qn("import_stage_org_members")
+    members = qn(OrganizationMember._meta.db_table)
+    users = qn(User._meta.db_table)
+    orgs = qn(Organization._meta.db_table)
+
     count = 0
-    for item in data:
-        org_id = item.get("orgId") or item.get("organizationId")
-        firebase_uid = item.get("userId") or item.get("uid")
-        if not org_id or not firebase_uid:
-            continue
+    for batch in batched(rows):
+        # One ON CONFLICT statement may not touch a row twice; last row wins.
+        by_key = {}
+        for org_id, firebase_uid, *rest in batch:
+            org_uuid = parse_uuid(org_id)
+            if org_uuid is not None:
+                by_key[(org_uuid, firebase_uid)] = (org_uuid, firebase_uid, *rest)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+                "(org_id uuid, firebase_uid text, role text, job_title text, status text)"
+            )
+            cursor.execute(f"TRUNCATE {stage}")
+            with cursor.copy(f"COPY {stage} FROM STDIN") as copy:
+                for row in by_key.values():
+                    copy.write_row(row)
+            cursor.execute(
+                f"INSERT INTO {members} (id, organization_id, user_id, role, job_title, status, joined_at) "
+                f"SELECT gen_random_uuid(), o.id, u.id, s.role, s.job_title, s.status, now() "
+                f"FROM {stage} s "
+                f"JOIN {users} u ON u.firebase_uid = s.firebase_uid "
+                f"JOIN {orgs} o ON o.id = s.org_id "
+                f"ON CONFLICT (organization_id, user_id) DO UPDATE SET "
+                f"role = EXCLUDED.role, job_title = EXCLUDED.job_title, status = EXCLUDED.status"
+            )
+            count += cursor.rowcount
+    return count
 
-        if not dry_run:
-            try:
-                org = Organization.objects.get(id=org_id)
-                user = User.objects.get(firebase_uid=firebase_uid)
-            except (Organization.DoesNotExist, User.DoesNotExist):
+
+def import_org_members(data, dry_run: bool) -> int:
+    from django.db import connection
+
+    from apps.organizations.models import Organization, OrganizationMember
+
+    VALID_ROLES = {"learner", "instructor", "team_lead", "ld_manager", "org_admin", "super_admin"}
+
+    def member_rows():
+        for item in data:
+            org_id = pick(item, "orgId", "organizationId", default=None)
+            firebase_uid = pick(item, "userId", "uid", default=None)
+            if not org_id or not firebase_uid:
                 continue
 
             role = item.get("role", "learner")
             if role not in VALID_ROLES:
                 role = "learner"
 
-            OrganizationMember.objects.update_or_create(
-                organization=org,
-                user=user,
-                defaults={
-                    "role": role,
-                    "job_title": item.get("jobTitle") or item.get("job_title", ""),
-                    "status": item.get("status", "active"),
-                },
+            yield (
+                org_id,
+                firebase_uid,
+                role,
+                pick(item, "jobTitle", "job_title"),
+                item.get("status", "active"),
             )
+
+    if dry_run:
+        return sum(1 for _ in member_rows())
+    if connection.vendor == "postgresql":
+        return join_org_members(member_rows())
+
+    writer = BulkUpserter(
+        OrganizationMember,
+        unique_fields=["organization", "user"],
+        update_fields=["role", "job_title", "status"],
+    )
+    count = 0
+    user_ids = user_id_map()
+    org_ids = pk_map(Organization)
+
+    for org_id, firebase_uid, role, job_title, status in member_rows():
+        org_pk = org_ids.get(parse_uuid(org_id))
+        if org_pk is None or firebase_uid not in user_ids:
+            continue
+
+        writer.add(OrganizationMember(
+            organization_id=org_pk,
+            user_id=user_ids[firebase_uid],
+            role=role,
+            job_title=job_title,
+            status=status,
+        ))
         count += 1
 
+    writer.flush()
     return count
 
 
-def import_courses(data: list, dry_run: bool) -> int:
-    from apps.accounts.models import User
+def import_courses(data, dry_run: bool) -> int:
     from apps.organizations.models import Organization
     from apps.courses.models import Course, CourseModule, Lesson
 
@@ -187,244 +528,304 @@ def import_courses(data: list, dry_run: bool) -> int:
         "text", "video", "audio", "quiz", "assignment",
         "scorm", "iframe",
     }
+
+    def import_modules(courses, items):
+        # Flatten the whole batch so modules and lessons each land in one
+        # upsert; ids are synthesised client-side, so FKs need no round-trip.
+        modules = []
+        lessons = []
+        for course, item in zip(courses, items):
+            for i, module_data in enumerate(item.get("modules", []) or []):
+                module_id = module_data.get("id") or f"{item['_id']}_mod_{i}"
+                modules.append(CourseModule(
+                    id=module_id,
+                    course_id=course.pk,
+                    title=module_data.get("title", f"Module {i + 1}"),
+                    description=module_data.get("description", ""),
+                    order_index=module_data.get("orderIndex", i),
+                ))
+
+                for j, lesson_data in enumerate(module_data.get("lessons", []) or []):
+                    lesson_type = pick(lesson_data, "type", "lesson_type", default="text")
+                    if lesson_type not in VALID_LESSON_TYPES:
+                        lesson_type = "text"
+
+                    lessons.append(Lesson(
+                        id=lesson_data.get("id") or f"{module_id}_les_{j}",
+                        module_id=module_id,
+                        title=lesson_data.get("title", f"Lesson {j + 1}"),
+                        lesson_type=lesson_type,
+                        order_index=lesson_data.get("orderIndex", j),
+                        content=lesson_data.get("content") or {},
+                        duration_minutes=lesson_data.get("durationMinutes") or 0,
+                    ))
+
+        upsert(
+            CourseModule, modules,
+            unique_fields=["id"],
+            update_fields=["course", "title", "description", "order_index"],
+        )
+        upsert(
+            Lesson, lessons,
+            unique_fields=["id"],
+            update_fields=["module", "title", "lesson_type", "order_index", "content", "duration_minutes"],
+        )
+
+    writer = BulkUpserter(
+        Course,
+        unique_fields=["id"],
+        update_fields=[
+            "organization", "title", "description", "status", "thumbnail_url",
+            "tags", "learning_objectives", "created_by",
+        ],
+        on_flush=import_modules,
+    )
     count = 0
+    if not dry_run:
+        user_ids = user_id_map()
+        org_ids = pk_map(Organization)
 
     for item in data:
-        org_id = item.get("orgId") or item.get("organizationId")
+        org_id = pick(item, "orgId", "organizationId", default=None)
         if not org_id:
             continue
 
         if not dry_run:
-            try:
-                org = Organization.objects.get(id=org_id)
-            except Organization.DoesNotExist:
+            org_pk = org_ids.get(parse_uuid(org_id))
+            if org_pk is None:
                 continue
 
-            created_by = None
-            if item.get("createdBy"):
-                created_by = User.objects.filter(firebase_uid=item["createdBy"]).first()
-
-            course, _ = Course.objects.update_or_create(
+            writer.add(Course(
                 id=item["_id"],
-                defaults={
-                    "organization": org,
-                    "title": item.get("title", "Untitled Course"),
-                    "description": item.get("description", ""),
-                    "status": item.get("status", "draft"),
-                    "thumbnail_url": item.get("thumbnailUrl") or item.get("thumbnail_url", ""),
-                    "tags": item.get("tags") or [],
-                    "learning_objectives": item.get("learningObjectives") or item.get("learning_objectives") or [],
-                    "created_by": created_by,
-                },
-            )
-
-            # Import modules
-            for i, module_data in enumerate(item.get("modules", []) or []):
-                module, _ = CourseModule.objects.update_or_create(
-                    id=module_data.get("id") or f"{item['_id']}_mod_{i}",
-                    defaults={
-                        "course": course,
-                        "title": module_data.get("title", f"Module {i + 1}"),
-                        "description": module_data.get("description", ""),
-                        "order_index": module_data.get("orderIndex", i),
-                    },
-                )
-
-                # Import lessons
-                for j, lesson_data in enumerate(module_data.get("lessons", []) or []):
-                    lesson_type = lesson_data.get("type") or lesson_data.get("lesson_type", "text")
-                    if lesson_type not in VALID_LESSON_TYPES:
-                        lesson_type = "text"
-
-                    Lesson.objects.update_or_create(
-                        id=lesson_data.get("id") or f"{module.id}_les_{j}",
-                        defaults={
-                            "module": module,
-                            "title": lesson_data.get("title", f"Lesson {j + 1}"),
-                            "lesson_type": lesson_type,
-                            "order_index": lesson_data.get("orderIndex", j),
-                            "content": lesson_data.get("content") or {},
-                            "duration_minutes": lesson_data.get("durationMinutes") or 0,
-                        },
-                    )
+                organization_id=org_pk,
+                title=item.get("title", "Untitled Course"),
+                description=item.get("description", ""),
+                status=item.get("status", "draft"),
+                thumbnail_url=pick(item, "thumbnailUrl", "thumbnail_url"),
+                tags=item.get("tags") or [],
+                learning_objectives=pick(item, "learningObjectives", "learning_objectives", default=[]),
+                created_by_id=user_ids.get(item.get("createdBy")),
+            ), extra=item)
 
         count += 1
 
+    writer.flush()
     return count
 
 
-def import_enrollments(data: list, dry_run: bool) -> int:
-    from apps.accounts.models import User
+def import_enrollments(data, dry_run: bool) -> int:
     from apps.courses.models import Course
     from apps.enrollments.models import Enrollment
     from apps.organizations.models import Organization
 
     VALID_STATUSES = {"pending", "enrolled", "in_progress", "completed", "dropped", "expired"}
+    writer = BulkUpserter(
+        Enrollment,
+        unique_fields=["user", "course", "organization"],
+        update_fields=["status", "progress_percentage", "started_at", "completed_at", "due_date"],
+        write=copy_upsert,
+    )
     count = 0
+    if not dry_run:
+        user_ids = user_id_map()
+        course_ids = pk_map(Course)
+        org_ids = pk_map(Organization)
 
     for item in data:
-        firebase_uid = item.get("userId") or item.get("uid")
+        firebase_uid = pick(item, "userId", "uid", default=None)
         course_id = item.get("courseId")
-        org_id = item.get("orgId") or item.get("organizationId")
+        org_id = pick(item, "orgId", "organizationId", default=None)
         if not (firebase_uid and course_id and org_id):
             continue
 
         if not dry_run:
-            try:
-                user = User.objects.get(firebase_uid=firebase_uid)
-                course = Course.objects.get(id=course_id)
-                org = Organization.objects.get(id=org_id)
-            except (User.DoesNotExist, Course.DoesNotExist, Organization.DoesNotExist):
+            course_pk = course_ids.get(parse_uuid(course_id))
+            org_pk = org_ids.get(parse_uuid(org_id))
+            if firebase_uid not in user_ids or course_pk is None or org_pk is None:
                 continue
 
             status = item.get("status", "enrolled")
             if status not in VALID_STATUSES:
                 status = "enrolled"
 
-            Enrollment.objects.update_or_create(
-                user=user,
-                course=course,
-                organization=org,
-                defaults={
-                    "status": status,
-                    "progress_percentage": item.get("progressPercentage") or item.get("progress_percentage", 0),
-                    "started_at": parse_dt(item.get("startedAt") or item.get("started_at")),
-                    "completed_at": parse_dt(item.get("completedAt") or item.get("completed_at")),
-                    "due_date": parse_dt(item.get("dueDate") or item.get("due_date")),
-                },
-            )
+            writer.add(build(Enrollment, {
+                "user_id": user_ids[firebase_uid],
+                "course_id": course_pk,
+                "organization_id": org_pk,
+                "status": status,
+                "progress_percentage": pick(item, "progressPercentage", "progress_percentage", default=0),
+                "started_at": parse_dt(pick(item, "startedAt", "started_at", default=None)),
+                "completed_at": parse_dt(pick(item, "completedAt", "completed_at", default=None)),
+                "due_date": parse_dt(pick(item, "dueDate", "due_date", default=None)),
+            }))
         count += 1
 
+    writer.flush()
     return count
 
 
-def import_progress(data: list, dry_run: bool) -> int:
-    from apps.accounts.models import User
+def import_progress(data, dry_run: bool) -> int:
     from apps.courses.models import Course
     from apps.progress.models import ProgressRecord
 
+    writer = BulkUpserter(
+        ProgressRecord,
+        unique_fields=["user", "course"],
+        update_fields=["completion_percentage", "total_time_spent", "last_accessed_at", "completed_at"],
+        write=copy_upsert,
+    )
     count = 0
+    if not dry_run:
+        user_ids = user_id_map()
+        course_ids = pk_map(Course)
+
     for item in data:
-        firebase_uid = item.get("userId") or item.get("uid")
+        firebase_uid = pick(item, "userId", "uid", default=None)
         course_id = item.get("courseId")
         if not (firebase_uid and course_id):
             continue
 
         if not dry_run:
-            try:
-                user = User.objects.get(firebase_uid=firebase_uid)
-                course = Course.objects.get(id=course_id)
-            except (User.DoesNotExist, Course.DoesNotExist):
+            course_pk = course_ids.get(parse_uuid(course_id))
+            if firebase_uid not in user_ids or course_pk is None:
                 continue
 
-            ProgressRecord.objects.update_or_create(
-                user=user,
-                course=course,
-                defaults={
-                    "completion_percentage": item.get("completionPercentage") or item.get("completion_percentage", 0),
-                    "total_time_spent": item.get("totalTimeSpent") or item.get("total_time_spent", 0),
-                    "last_accessed_at": parse_dt(item.get("lastAccessedAt") or item.get("last_accessed_at")),
-                    "completed_at": parse_dt(item.get("completedAt") or item.get("completed_at")),
-                },
-            )
+            writer.add(build(ProgressRecord, {
+                "user_id": user_ids[firebase_uid],
+                "course_id": course_pk,
+                # Stored as basis points (10000 = 100.00%).
+                "completion_percentage": round(
+                    float(pick(item, "completionPercentage", "completion_percentage", default=0)) * 100
+                ),
+                "total_time_spent": pick(item, "totalTimeSpent", "total_time_spent", default=0),
+                "last_accessed_at": parse_dt(pick(item, "lastAccessedAt", "last_accessed_at", default=None)),
+                "completed_at": parse_dt(pick(item, "completedAt", "completed_at", default=None)),
+            }))
         count += 1
 
+    writer.flush()
     return count
 
 
-def import_genie_sources(data: list, dry_run: bool) -> int:
-    from apps.accounts.models import User
+def import_genie_sources(data, dry_run: bool) -> int:
     from apps.genie.models import GenieSource
     from apps.organizations.models import Organization
 
     VALID_TYPES = {"document", "url", "video", "audio", "text"}
+    writer = BulkUpserter(
+        GenieSource,
+        unique_fields=["id"],
+        update_fields=["organization", "created_by", "name", "source_type", "url", "file_path", "status", "metadata"],
+    )
     count = 0
+    if not dry_run:
+        user_ids = user_id_map()
+        org_ids = pk_map(Organization)
 
     for item in data:
-        org_id = item.get("orgId") or item.get("organizationId")
+        org_id = pick(item, "orgId", "organizationId", default=None)
         if not org_id:
             continue
 
         if not dry_run:
-            try:
-                org = Organization.objects.get(id=org_id)
-            except Organization.DoesNotExist:
+            org_pk = org_ids.get(parse_uuid(org_id))
+            if org_pk is None:
                 continue
 
-            created_by = None
-            if item.get("uploadedBy") or item.get("createdBy"):
-                uid = item.get("uploadedBy") or item.get("createdBy")
-                created_by = User.objects.filter(firebase_uid=uid).first()
-
-            source_type = item.get("type") or item.get("source_type", "document")
+            source_type = pick(item, "type", "source_type", default="document")
             if source_type not in VALID_TYPES:
                 source_type = "document"
 
-            GenieSource.objects.update_or_create(
+            writer.add(GenieSource(
                 id=item["_id"],
-                defaults={
-                    "organization": org,
-                    "created_by": created_by,
-                    "name": item.get("title") or item.get("name", "Untitled Source"),
-                    "source_type": source_type,
-                    "url": item.get("fileUrl") or item.get("url", ""),
-                    "file_path": item.get("fileName") or item.get("file_path", ""),
-                    "status": item.get("status", "pending"),
-                    "metadata": {
-                        "tags": item.get("tags", []),
-                        "description": item.get("description", ""),
-                        "fileType": item.get("fileType", ""),
-                        "fileSize": item.get("fileSize"),
-                        "version": item.get("version", 1),
-                        "sourceKey": item.get("sourceKey", ""),
-                    },
+                organization_id=org_pk,
+                created_by_id=user_ids.get(pick(item, "uploadedBy", "createdBy", default=None)),
+                name=pick(item, "title", "name", default="Untitled Source"),
+                source_type=source_type,
+                url=pick(item, "fileUrl", "url"),
+                file_path=pick(item, "fileName", "file_path"),
+                status=item.get("status", "pending"),
+                metadata={
+                    "tags": item.get("tags", []),
+                    "description": item.get("description", ""),
+                    "fileType": item.get("fileType", ""),
+                    "fileSize": item.get("fileSize"),
+                    "version": item.get("version", 1),
+                    "sourceKey": item.get("sourceKey", ""),
                 },
-            )
+            ))
         count += 1
 
+    writer.flush()
     return count
 
 
-def import_genie_pipelines(data: list, dry_run: bool) -> int:
-    from apps.accounts.models import User
+def import_genie_pipelines(data, dry_run: bool) -> int:
     from apps.genie.models import GeniePipeline, GenieSource
     from apps.organizations.models import Organization
 
+    Through = GeniePipeline.sources.through
+
+    def link_sources(pipelines, pipeline_source_ids):
+        # Link sources by ID, replacing each pipeline's links like sources.set()
+        pairs = [
+            (pipeline.pk, source_id)
+            for pipeline, source_ids in zip(pipelines, pipeline_source_ids)
+            if source_ids and isinstance(source_ids[0], str)
+            for source_id in source_ids
+        ]
+        if not pairs:
+            return
+        pipeline_ids = {pipeline_id for pipeline_id, _ in pairs}
+        valid = {
+            str(pk)
+            for pk in GenieSource.objects.filter(
+                id__in={source_id for _, source_id in pairs}
+            ).values_list("id", flat=True)
+        }
+        Through.objects.filter(geniepipeline_id__in=pipeline_ids).delete()
+        Through.objects.bulk_create(
+            [
+                Through(geniepipeline_id=pipeline_id, geniesource_id=source_id)
+                for pipeline_id, source_id in pairs
+                if str(source_id) in valid
+            ],
+            ignore_conflicts=True,
+        )
+
+    writer = BulkUpserter(
+        GeniePipeline,
+        unique_fields=["id"],
+        update_fields=["organization", "created_by", "name", "status", "config"],
+        on_flush=link_sources,
+    )
     count = 0
+    if not dry_run:
+        user_ids = user_id_map()
+        org_ids = pk_map(Organization)
+
     for item in data:
-        org_id = item.get("orgId") or item.get("organizationId")
+        org_id = pick(item, "orgId", "organizationId", default=None)
         if not org_id:
             continue
 
         if not dry_run:
-            try:
-                org = Organization.objects.get(id=org_id)
-            except Organization.DoesNotExist:
+            org_pk = org_ids.get(parse_uuid(org_id))
+            if org_pk is None:
                 continue
 
-            created_by = None
-            if item.get("createdBy"):
-                created_by = User.objects.filter(firebase_uid=item["createdBy"]).first()
-
-            pipeline, _ = GeniePipeline.objects.update_or_create(
+            writer.add(GeniePipeline(
                 id=item["_id"],
-                defaults={
-                    "organization": org,
-                    "created_by": created_by,
-                    "name": item.get("name", "Untitled Pipeline"),
-                    "status": item.get("status", "draft"),
-                    "config": item.get("config") or {},
-                },
-            )
-
-            # Link sources by ID
-            source_ids = item.get("sourceIds") or item.get("sources") or []
-            if source_ids and isinstance(source_ids[0], str):
-                sources = GenieSource.objects.filter(id__in=source_ids)
-                pipeline.sources.set(sources)
+                organization_id=org_pk,
+                created_by_id=user_ids.get(item.get("createdBy")),
+                name=item.get("name", "Untitled Pipeline"),
+                status=item.get("status", "draft"),
+                config=item.get("config") or {},
+            ), extra=pick(item, "sourceIds", "sources", default=[]))
 
         count += 1
 
+    writer.flush()
     return count
 
 
@@ -444,6 +845,56 @@ IMPORTERS = [
 ]
 
 
+# Collections within a stage only depend on earlier stages, so they can be
+# imported concurrently. Pipelines link to Genie sources, so sources land a
+# stage earlier.
+STAGES = [
+    ["users", "organizations"],
+    ["orgMembers", "courses", "genieSources"],
+    ["enrollments", "progress", "geniePipelines"],
+]
+
+
+def run_importer(path: str, collection_key: str, dry_run: bool) -> int:
+    """Import one collection; the entry point for each worker process."""
+    bootstrap_django()
+    importer_fn = dict(IMPORTERS)[collection_key]
+    return importer_fn(FirestoreExport(path).records(collection_key), dry_run=dry_run)
+
+
+def import_collections(export: FirestoreExport, args) -> int:
+    from django.db import connection, connections
+
+    total_imported = 0
+    # SQLite allows one writer at a time, so parallel stages would only
+    # contend for the file lock and fail with "database is locked".
+    if args.workers <= 1 or connection.vendor != "postgresql":
+        for collection_key, importer_fn in IMPORTERS:
+            print(f"  [{collection_key}] importing...", end="", flush=True)
+            count = importer_fn(export.records(collection_key), dry_run=args.dry_run)
+            print(f" done ({count} processed)")
+            total_imported += count
+            if collection_key in MAPPED_COLLECTIONS:
+                user_id_map.cache_clear()
+                pk_map.cache_clear()
+        return total_imported
+
+    # Forked workers must not share the parent's database connection.
+    connections.close_all()
+    for stage in STAGES:
+        print(f"  importing {', '.join(stage)}...", flush=True)
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(stage))) as pool:
+            futures = {
+                key: pool.submit(run_importer, args.input, key, args.dry_run)
+                for key in stage
+            }
+            for collection_key, future in futures.items():
+                count = future.result()
+                print(f"  [{collection_key}] done ({count} processed)")
+                total_imported += count
+    return total_imported
+
+
 def main():
     args = parse_args()
 
@@ -451,30 +902,23 @@ def main():
 
     print(f"Loading export file: {args.input}")
     try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            export = json.load(f)
+        export = FirestoreExport(args.input)
     except FileNotFoundError:
         print(f"ERROR: File not found: {args.input}")
         sys.exit(1)
 
-    collections = export.get("collections", export)  # support both formats
-    exported_at = export.get("exported_at", "unknown")
-    print(f"Exported at: {exported_at}")
+    print(f"Exported at: {export.exported_at}")
 
     if args.dry_run:
         print("\n*** DRY RUN — no data will be written ***\n")
 
-    total_imported = 0
-    for collection_key, importer_fn in IMPORTERS:
-        data = collections.get(collection_key, [])
-        if not data:
-            print(f"  [{collection_key}] skipped (no data)")
-            continue
-
-        print(f"  [{collection_key}] importing {len(data)} records...", end="", flush=True)
-        count = importer_fn(data, dry_run=args.dry_run)
-        print(f" done ({count} processed)")
-        total_imported += count
+    deferred_indexes = [] if args.dry_run else drop_secondary_indexes()
+    try:
+        total_imported = import_collections(export, args)
+    finally:
+        if deferred_indexes:
+            print(f"  rebuilding {len(deferred_indexes)} deferred indexes...", flush=True)
+            restore_indexes(deferred_indexes)
 
     print(f"\nImport {'simulation' if args.dry_run else 'complete'} — {total_imported} total records processed.")
 
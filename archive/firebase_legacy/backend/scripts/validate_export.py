@@ -28,6 +28,8 @@ import json
 import sys
 from collections import Counter
 
+from export_reader import load_json
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -289,8 +291,7 @@ def main():
 
     print(f"Loading: {args.input}")
     try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            export = json.load(f)
+        export = load_json(args.input)
     except FileNotFoundError:
         print(f"ERROR: File not found: {args.input}")
         sys.exit(2)
@@ -17,11 +17,12 @@ Exit code: 0 = all checks passed, 1 = some checks failed.
 """
 
 import argparse
-import json
 import os
 import random
 import sys
 
+from export_reader import FirestoreExport
+
 
 # ---------------------------------------------------------------------------
 # Django bootstrap
@@ -55,33 +56,63 @@ def check(label: str, passed: bool, detail: str = "") -> bool:
 # ---------------------------------------------------------------------------
 # Verification steps
 # ---------------------------------------------------------------------------
-def verify_counts(collections: dict) -> list[bool]:
-    from apps.accounts.models import User
-    from apps.courses.models import Course
-    from apps.enrollments.models import Enrollment
-    from apps.genie.models import GenieSource, GeniePipeline
-    from apps.organizations.models import Organization, OrganizationMember
-    from apps.progress.models import ProgressRecord
-
-    mapping = [
-        ("users",          User,               collections.get("users", [])),
-        ("organizations",  Organization,        collections.get("organizations", [])),
-        ("orgMembers",     OrganizationMember,  collections.get("orgMembers", [])),
-        ("courses",        Course,              collections.get("courses", [])),
-        ("enrollments",    Enrollment,          collections.get("enrollments", [])),
-        ("progress",       ProgressRecord,      collections.get("progress", [])),
-        ("genieSources",   GenieSource,         collections.get("genieSources", [])),
-        ("geniePipelines", GeniePipeline,       collections.get("geniePipelines", [])),
-    ]
-
+COLLECTION_MODELS = [
+    ("users",          "accounts.User"),
+    ("organizations",  "organizations.Organization"),
+    ("orgMembers",     "organizations.OrganizationMember"),
+    ("courses",        "courses.Course"),
+    ("enrollments",    "enrollments.Enrollment"),
+    ("progress",       "progress.ProgressRecord"),
+    ("genieSources",   "genie.GenieSource"),
+    ("geniePipelines", "genie.GeniePipeline"),
+]
+
+
+def collect_db_stats() -> dict:
+    """
+    Fetch every database-side figure the checks need in one round-trip: a
+    single SELECT of scalar subqueries (row counts, blank fields, null FKs).
+    """
+    from django.apps import apps
+    from django.db import connection
+
+    qn = connection.ops.quote_name
+
+    def table(label):
+        return qn(apps.get_model(label)._meta.db_table)
+
+    def column(label, field):
+        return qn(apps.get_model(label)._meta.get_field(field).column)
+
+    def count(label, where=""):
+        return f"SELECT COUNT(*) FROM {table(label)}" + (f" WHERE {where}" if where else "")
+
+    queries = {name: count(label) for name, label in COLLECTION_MODELS}
+    queries.update({
+        "blank_emails": count("accounts.User", f"{column('accounts.User', 'email')} = ''"),
+        "users_with_uid": count("accounts.User", f"{column('accounts.User', 'firebase_uid')} IS NOT NULL"),
+        "blank_org_names": count("organizations.Organization", f"{column('organizations.Organization', 'name')} = ''"),
+        "blank_course_titles": count("courses.Course", f"{column('courses.Course', 'title')} = ''"),
+        "null_enrollment_users": count("enrollments.Enrollment", f"{column('enrollments.Enrollment', 'user')} IS NULL"),
+        "null_enrollment_courses": count("enrollments.Enrollment", f"{column('enrollments.Enrollment', 'course')} IS NULL"),
+        "null_progress_users": count("progress.ProgressRecord", f"{column('progress.ProgressRecord', 'user')} IS NULL"),
+    })
+    sql = "SELECT " + ", ".join(f"({query})" for query in queries.values())
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        row = cursor.fetchone()
+    return dict(zip(queries, row))
+
+
+def verify_counts(export: FirestoreExport, stats: dict) -> list[bool]:
     results = []
     print("\n[Count parity]")
-    for name, model, export_data in mapping:
-        export_count = len(export_data)
+    for name, _ in COLLECTION_MODELS:
+        export_count = sum(1 for _ in export.records(name))
         if export_count == 0:
             print(f"  [----] {name:<20} — no export data, skipping")
             continue
-        db_count = model.objects.count()
+        db_count = stats[name]
         pct = round((db_count / export_count) * 100) if export_count else 0
         passed = db_count >= export_count * 0.95  # allow up to 5% skip rate
         results.append(
@@ -94,50 +125,57 @@ def verify_counts(collections: dict) -> list[bool]:
     return results
 
 
-def verify_user_emails(export_users: list) -> list[bool]:
+def verify_user_emails(export_users) -> list[bool]:
+    from django.db.models.functions import Lower
+
     from apps.accounts.models import User
 
-    if not export_users:
+    # Reservoir sample, so the users collection is streamed rather than loaded.
+    sample = []
+    for seen, item in enumerate(export_users):
+        if seen < 10:
+            sample.append(item)
+        else:
+            slot = random.randint(0, seen)
+            if slot < 10:
+                sample[slot] = item
+    if not sample:
         return []
 
     print("\n[User email spot-check (10 random)]")
-    sample = random.sample(export_users, min(10, len(export_users)))
-    results = []
-    for item in sample:
-        email = (item.get("email") or "").strip().lower()
-        if not email:
-            continue
-        exists = User.objects.filter(email__iexact=email).exists()
-        results.append(check(f"email '{email}'", exists))
-    return results
-
+    emails = [(item.get("email") or "").strip().lower() for item in sample]
+    emails = [email for email in emails if email]
+    # Emails are imported as written, so compare case-insensitively in one query.
+    found = set(
+        User.objects.annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=emails)
+        .values_list("email_lower", flat=True)
+    )
+    return [check(f"email '{email}'", email in found) for email in emails]
 
-def verify_data_quality() -> list[bool]:
-    from apps.accounts.models import User
-    from apps.courses.models import Course
-    from apps.organizations.models import Organization
 
+def verify_data_quality(stats: dict) -> list[bool]:
     print("\n[Data quality]")
     results = []
 
     # No users with blank email
-    blank_emails = User.objects.filter(email="").count()
+    blank_emails = stats["blank_emails"]
     results.append(check("No users with blank email", blank_emails == 0,
                           f"{blank_emails} found" if blank_emails else ""))
 
     # No orgs with blank name
-    blank_names = Organization.objects.filter(name="").count()
+    blank_names = stats["blank_org_names"]
     results.append(check("No orgs with blank name", blank_names == 0,
                           f"{blank_names} found" if blank_names else ""))
 
     # No courses with blank title
-    blank_titles = Course.objects.filter(title="").count()
+    blank_titles = stats["blank_course_titles"]
     results.append(check("No courses with blank title", blank_titles == 0,
                           f"{blank_titles} found" if blank_titles else ""))
 
     # All Firebase-migrated users have firebase_uid
-    firebase_users = User.objects.filter(firebase_uid__isnull=False).count()
-    total_users = User.objects.count()
+    firebase_users = stats["users_with_uid"]
+    total_users = stats["users"]
     results.append(check(
         f"firebase_uid coverage",
         True,  # informational
@@ -147,15 +185,12 @@ def verify_data_quality() -> list[bool]:
     return results
 
 
-def verify_fk_integrity() -> list[bool]:
-    from apps.enrollments.models import Enrollment
-    from apps.progress.models import ProgressRecord
-
+def verify_fk_integrity(stats: dict) -> list[bool]:
     print("\n[Foreign-key integrity]")
     results = []
 
     # Enrollments with null user
-    null_user_enrollments = Enrollment.objects.filter(user__isnull=True).count()
+    null_user_enrollments = stats["null_enrollment_users"]
     results.append(check(
         "Enrollments: no null user",
         null_user_enrollments == 0,
@@ -163,7 +198,7 @@ def verify_fk_integrity() -> list[bool]:
     ))
 
     # Enrollments with null course
-    null_course_enrollments = Enrollment.objects.filter(course__isnull=True).count()
+    null_course_enrollments = stats["null_enrollment_courses"]
     results.append(check(
         "Enrollments: no null course",
         null_course_enrollments == 0,
@@ -171,7 +206,7 @@ def verify_fk_integrity() -> list[bool]:
     ))
 
     # Progress with null user
-    null_user_progress = ProgressRecord.objects.filter(user__isnull=True).count()
+    null_user_progress = stats["null_progress_users"]
     results.append(check(
         "Progress: no null user",
         null_user_progress == 0,
@@ -202,21 +237,20 @@ def main():
 
     print(f"Loading export: {args.input}")
     try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            export = json.load(f)
+        export = FirestoreExport(args.input)
     except FileNotFoundError:
         print(f"ERROR: Export file not found: {args.input}")
         sys.exit(1)
 
-    collections = export.get("collections", export)
-    exported_at = export.get("exported_at", "unknown")
-    print(f"Exported at:  {exported_at}")
+    print(f"Exported at:  {export.exported_at}")
+
+    stats = collect_db_stats()
 
     all_results: list[bool] = []
-    all_results += verify_counts(collections)
-    all_results += verify_user_emails(collections.get("users", []))
-    all_results += verify_data_quality()
-    all_results += verify_fk_integrity()
+    all_results += verify_counts(export, stats)
+    all_results += verify_user_emails(export.records("users"))
+    all_results += verify_data_quality(stats)
+    all_results += verify_fk_integrity(stats)
 
     passed = sum(1 for r in all_results if r)
     failed = len(all_results) - passed
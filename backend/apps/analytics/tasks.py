@@ -11,6 +11,7 @@ from apps.progress.models import LessonProgress
 from apps.assessments.models import AssessmentAttempt
 from apps.notifications.services import enqueue_notification
 
+from .services import create_audit_log
 from .models import (
     DailyStats, AnalyticsJob, GenieReportSchedule, GenieReportRun, ManagerDigestRun,
     BloomAnalyticsSnapshot, WorkforceCapabilityIndex, DepartmentBloomTrend,
@@ -51,6 +52,11 @@ def _create_or_update_daily_stats(org_id: str, date):
     )
 
 
+@shared_task
+def create_audit_log_task(**kwargs) -> None:
+    create_audit_log(**kwargs)
+
+
 @shared_task
 def start_analytics_job_task(org_id: str, mode: str = 'scheduled') -> str:
     job = AnalyticsJob.objects.create(
@@ -4,7 +4,7 @@ from django.dispatch import receiver
 from .models import Course
 from apps.analytics.services import create_audit_log
 from apps.webhooks.services import enqueue_event
-from apps.webhooks.tasks import deliver_webhook_task
+from apps.webhooks.tasks import queue_deliveries
 
 
 @receiver(pre_save, sender=Course)
@@ -40,5 +40,4 @@ def handle_course_publish(sender, instance: Course, **kwargs):
             'courseId': str(instance.id),
             'title': instance.title
         })
-        for delivery in deliveries:
-            deliver_webhook_task.delay(str(delivery.id))
+        queue_deliveries(deliveries)
@@ -6,7 +6,7 @@ from apps.organizations.models import OrganizationMember
 from apps.notifications.services import enqueue_notification
 from apps.analytics.services import create_audit_log
 from apps.webhooks.services import enqueue_event
-from apps.webhooks.tasks import deliver_webhook_task
+from apps.webhooks.tasks import queue_deliveries
 from apps.certificates.services import issue_certificate
 
 
@@ -56,8 +56,7 @@ def handle_enrollment_events(sender, instance: Enrollment, created: bool, **kwar
             'userId': user_id,
             'courseId': str(instance.course_id)
         })
-        for delivery in deliveries:
-            deliver_webhook_task.delay(str(delivery.id))
+        queue_deliveries(deliveries)
 
     previous = getattr(instance, '_previous_status', None)
     if previous != instance.status and instance.status == 'completed':
@@ -103,12 +102,10 @@ def handle_enrollment_events(sender, instance: Enrollment, created: bool, **kwar
                 'userId': user_id,
                 'courseId': str(instance.course_id),
             })
-            for delivery in deliveries:
-                deliver_webhook_task.delay(str(delivery.id))
+            queue_deliveries(deliveries)
         deliveries = enqueue_event(org_id, 'enrollment.completed', {
             'enrollmentId': str(instance.id),
             'userId': user_id,
             'courseId': str(instance.course_id)
         })
-        for delivery in deliveries:
-            deliver_webhook_task.delay(str(delivery.id))
+        queue_deliveries(deliveries)
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0003_rename_organizatio_organiz_30180c_idx_organizatio_organiz_041ef2_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(fields=['user', 'status'], name='om_user_status_idx'),
+        ),
+    ]
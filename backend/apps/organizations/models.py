@@ -62,6 +62,9 @@ class OrganizationMember(models.Model):
     class Meta:
         db_table = 'organization_members'
         unique_together = ['organization', 'user']
+        indexes = [
+            models.Index(fields=['user', 'status'], name='om_user_status_idx'),
+        ]
 
 
 class Department(models.Model):
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.utils.text import slugify
+
+from tuutta_backend.serializers import CachedFieldsModelSerializer
 from .models import (
     Organization,
     OrganizationMember,
@@ -11,7 +13,7 @@ from .models import (
 )
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
+class OrganizationSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Organization
         fields = ['id', 'name', 'slug', 'description', 'logo_url', 'plan', 'settings', 'is_active', 'created_at', 'updated_at']
@@ -25,7 +27,7 @@ class OrganizationMemberSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'joined_at']
 
 
-class OrganizationMemberDetailSerializer(serializers.ModelSerializer):
+class OrganizationMemberDetailSerializer(CachedFieldsModelSerializer):
     """Membership detail including user email/name for the current-user memberships endpoint."""
     user_email = serializers.EmailField(source='user.email', read_only=True)
     user_name = serializers.SerializerMethodField()
@@ -45,14 +47,14 @@ class OrganizationMemberDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'joined_at', 'user_email', 'user_name', 'org_name', 'org_slug']
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Department
         fields = ['id', 'organization', 'name', 'description', 'parent', 'manager', 'created_at']
         read_only_fields = ['id', 'created_at']
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Team
         fields = ['id', 'organization', 'department', 'name', 'description', 'lead', 'created_at']
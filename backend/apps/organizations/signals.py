@@ -4,7 +4,7 @@ from django.dispatch import receiver
 from .models import Organization, OrganizationMember
 from apps.analytics.services import create_audit_log
 from apps.webhooks.services import enqueue_event
-from apps.webhooks.tasks import deliver_webhook_task
+from apps.webhooks.tasks import queue_deliveries
 
 
 @receiver(pre_save, sender=Organization)
@@ -43,8 +43,7 @@ def handle_policy_updates(sender, instance: Organization, created: bool, **kwarg
             'organizationId': str(instance.id),
             'name': instance.name,
         })
-        for delivery in deliveries:
-            deliver_webhook_task.delay(str(delivery.id))
+        queue_deliveries(deliveries)
 
 
 @receiver(post_save, sender=OrganizationMember)
@@ -70,5 +69,4 @@ def handle_member_created(sender, instance: OrganizationMember, created: bool, *
         'userId': str(user.id),
         'role': instance.role,
     })
-    for delivery in deliveries:
-        deliver_webhook_task.delay(str(delivery.id))
+    queue_deliveries(deliveries)
@@ -1,9 +1,11 @@
 """API tests for the organizations endpoints."""
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse, NoReverseMatch
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
-from apps.organizations.models import Organization, OrganizationMember
+from apps.organizations.models import Department, Organization, OrganizationInviteCode, OrganizationMember, Team
 
 User = get_user_model()
 
@@ -106,6 +108,17 @@ class TestOrganizationViewSet:
         assert resp.status_code == 200
         assert resp.data["id"] == org_id
 
+    def test_list_matches_detail_representation(self, master_client):
+        create_resp = master_client.post(
+            reverse("organization-list"),
+            {"name": "Listed Org", "slug": "listed-org", "plan": "free"},
+            format="json",
+        )
+        detail = master_client.get(reverse("organization-detail", kwargs={"pk": create_resp.data["id"]}))
+        resp = master_client.get(reverse("organization-list"))
+        assert resp.status_code == 200
+        assert resp.data["results"] == [detail.data]
+
     def test_list_departments(self, auth_client, org_admin):
         """List departments nested under an organization (nested router)."""
         org = Organization.objects.create(
@@ -219,7 +232,9 @@ class TestOrganizationViewSet:
         assert approve.data["code"] == "organization_slug_conflict"
         assert approve.data["existing_org_slug"] == "existing-org"
 
-    def test_organization_request_approve_succeeds_when_audit_log_fails(self, auth_client, master_client, monkeypatch):
+    def test_organization_request_approve_succeeds_when_audit_log_fails(
+        self, auth_client, master_client, monkeypatch, django_capture_on_commit_callbacks
+    ):
         from apps.organizations import views as organization_views
 
         create_request = auth_client.post(
@@ -232,14 +247,16 @@ class TestOrganizationViewSet:
         def _raise_audit_failure(**_kwargs):
             raise RuntimeError("audit unavailable")
 
-        monkeypatch.setattr(organization_views, "create_audit_log", _raise_audit_failure)
+        monkeypatch.setattr(organization_views.create_audit_log_task, "delay", _raise_audit_failure)
 
         request_id = create_request.data["id"]
-        approve = master_client.post(
-            reverse("organization-request-approve", kwargs={"pk": request_id}),
-            {},
-            format="json",
-        )
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            approve = master_client.post(
+                reverse("organization-request-approve", kwargs={"pk": request_id}),
+                {},
+                format="json",
+            )
+        assert callbacks
         assert approve.status_code == 200
         assert approve.data["status"] == "approved"
 
@@ -323,3 +340,120 @@ class TestOrganizationViewSet:
         assert redeem.status_code == 200
         assert redeem.data["organization"]["slug"] == "invite-org"
         assert OrganizationMember.objects.filter(organization=org, user=invitee).exists()
+
+    def test_invite_code_deactivates_at_max_uses(self, api_client, org_admin):
+        org = Organization.objects.create(
+            name="Single Use Org",
+            slug="single-use-org",
+            created_by=org_admin,
+        )
+        invite = OrganizationInviteCode.objects.create(organization=org, code="SINGLEUSE", max_uses=1)
+        User.objects.create_user(
+            username="single@example.com",
+            email="single@example.com",
+            password="SinglePass1!",
+        )
+        login = api_client.post(
+            reverse("login"),
+            {"email": "single@example.com", "password": "SinglePass1!"},
+            format="json",
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {login.data.get('access')}")
+
+        redeem = api_client.post(reverse("invite-code-redeem"), {"code": "singleuse"}, format="json")
+        assert redeem.status_code == 200
+        assert redeem.data["member"]["org_slug"] == "single-use-org"
+        assert redeem.data["member"]["user_email"] == "single@example.com"
+        invite.refresh_from_db()
+        assert invite.used_count == 1
+        assert invite.is_active is False
+
+    def test_bulk_invite_codes(self, master_client, master_user):
+        org = Organization.objects.create(name="Bulk Org", slug="bulk-org", created_by=master_user)
+        resp = master_client.post(
+            reverse("organization-invite-codes-bulk-create", kwargs={"organization_pk": str(org.id)}),
+            {"count": 3, "role": "instructor"},
+            format="json",
+        )
+        assert resp.status_code == 201
+        assert len(resp.data) == 3
+        codes = OrganizationInviteCode.objects.filter(organization=org, role="instructor")
+        assert codes.count() == 3
+        assert all(code.code.isupper() or code.code.isdigit() for code in codes)
+
+
+class TestListQueryCounts:
+    """List endpoints must not issue per-row queries for related objects."""
+
+    @staticmethod
+    def assert_flat_query_count(client, url, add_rows, django_assert_num_queries):
+        client.get(url)  # warm per-process caches
+        with CaptureQueriesContext(connection) as baseline:
+            assert client.get(url).status_code == 200
+        add_rows()
+        with django_assert_num_queries(len(baseline)):
+            resp = client.get(url)
+        assert resp.status_code == 200
+        return resp
+
+    @staticmethod
+    def make_member_org(user, slug):
+        org = Organization.objects.create(name=slug.title(), slug=slug, created_by=user)
+        OrganizationMember.objects.create(organization=org, user=user, role="org_admin", status="active")
+        return org
+
+    def test_my_memberships(self, auth_client, org_admin, django_assert_num_queries):
+        self.make_member_org(org_admin, "me-org-0")
+
+        def add_rows():
+            for i in range(1, 4):
+                self.make_member_org(org_admin, f"me-org-{i}")
+
+        resp = self.assert_flat_query_count(
+            auth_client, reverse("my-memberships"), add_rows, django_assert_num_queries
+        )
+        rows = resp.data["results"] if isinstance(resp.data, dict) else resp.data
+        assert len(rows) == 4
+        assert {row["org_slug"] for row in rows} == {f"me-org-{i}" for i in range(4)}
+
+    def test_organization_list(self, auth_client, org_admin, django_assert_num_queries):
+        self.make_member_org(org_admin, "list-org-0")
+
+        def add_rows():
+            for i in range(1, 4):
+                self.make_member_org(org_admin, f"list-org-{i}")
+
+        self.assert_flat_query_count(
+            auth_client, reverse("organization-list"), add_rows, django_assert_num_queries
+        )
+
+    def test_department_list(self, auth_client, org_admin, django_assert_num_queries):
+        org = self.make_member_org(org_admin, "dept-org")
+        Department.objects.create(organization=org, name="Dept 0")
+
+        def add_rows():
+            for i in range(1, 4):
+                Department.objects.create(organization=org, name=f"Dept {i}")
+
+        self.assert_flat_query_count(
+            auth_client,
+            reverse("organization-departments-list", kwargs={"organization_pk": str(org.id)}),
+            add_rows,
+            django_assert_num_queries,
+        )
+
+    def test_team_list(self, auth_client, org_admin, django_assert_num_queries):
+        org = self.make_member_org(org_admin, "team-org")
+        dept = Department.objects.create(organization=org, name="Dept")
+        Team.objects.create(organization=org, department=dept, name="Team 0", lead=org_admin)
+
+        def add_rows():
+            for i in range(1, 4):
+                Team.objects.create(organization=org, department=dept, name=f"Team {i}", lead=org_admin)
+
+        self.assert_flat_query_count(
+            auth_client,
+            reverse("organization-teams-list", kwargs={"organization_pk": str(org.id)}),
+            add_rows,
+            django_assert_num_queries,
+        )
@@ -1,9 +1,13 @@
+import base64
 import logging
+import os
 import secrets
 
 from django.db import IntegrityError, transaction
+from django.db.models import Case, Exists, F, OuterRef, Value, When
+from django.db.models.signals import post_save
 from django.utils import timezone
-from rest_framework import generics, status, viewsets
+from rest_framework import generics, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
@@ -27,82 +31,216 @@ from .serializers import (
     OrganizationSerializer,
     TeamSerializer,
 )
-from apps.analytics.services import create_audit_log
+from apps.analytics.tasks import create_audit_log_task
+from tuutta_backend.auto_prefetch import AutoPrefetchMixin, only_fields
 
 logger = logging.getLogger(__name__)
 
+ADMIN_ROLES = frozenset({'org_admin', 'ld_manager', 'super_admin'})
+_INVITE_CODE_STRIP = str.maketrans('', '', '-_')
+MAX_BULK_INVITE_CODES = 100
 
-def safe_create_audit_log(**kwargs):
+_datetime_field = serializers.DateTimeField()
+
+
+def _member_detail_only_fields():
+    # `user_name` is a SerializerMethodField reading these two user columns.
+    return only_fields(
+        OrganizationMemberDetailSerializer,
+        OrganizationMember,
+        extra=('user__display_name', 'user__username'),
+    )
+
+
+def _dispatch_audit_log(kwargs):
     try:
-        create_audit_log(**kwargs)
+        create_audit_log_task.delay(**kwargs)
     except Exception:
-        logger.exception('Audit log write failed; request flow continued.')
+        logger.exception('Audit log dispatch failed; request flow continued.')
 
 
-def ensure_org_access(request, org_id):
-    org = Organization.objects.filter(id=org_id, is_active=True).first()
-    if not org:
-        raise NotFound('Organization not found.')
+def safe_create_audit_log(**kwargs):
+    """Queue the audit log write once the surrounding transaction commits, off the request path."""
+    transaction.on_commit(lambda: _dispatch_audit_log(kwargs))
+
+
+def generate_invite_codes(count):
+    """
+    Generate `count` invite codes shaped like `token_urlsafe(8)` ones.
+
+    The entropy for the whole batch comes from a single `os.urandom` call
+    rather than one syscall per code.
+    """
+    entropy = os.urandom(count * 8)
+    return [
+        base64.urlsafe_b64encode(entropy[offset:offset + 8]).rstrip(b'=').decode('ascii')
+        .translate(_INVITE_CODE_STRIP)[:20].upper()
+        for offset in range(0, count * 8, 8)
+    ]
+
+
+def ensure_member(org, user, role, status='active'):
+    """
+    Insert the membership unless one exists; returns `(member, created)`.
+
+    One `INSERT ... ON CONFLICT DO NOTHING` plus one SELECT replaces
+    `get_or_create`'s SELECT/SAVEPOINT/INSERT. `bulk_create` skips model
+    signals, so `post_save` is sent by hand for a new row to keep the
+    member-created audit log and webhooks firing.
+    """
+    candidate = OrganizationMember(organization=org, user=user, role=role, status=status)
+    OrganizationMember.objects.bulk_create([candidate], ignore_conflicts=True)
+    member = OrganizationMember.objects.filter(organization=org, user=user).select_related(
+        'organization', 'user',
+    ).only(*_member_detail_only_fields()).get()
+    if member.pk != candidate.pk:
+        return member, False
+    post_save.send(
+        sender=OrganizationMember,
+        instance=candidate,
+        created=True,
+        update_fields=None,
+        raw=False,
+        using=candidate._state.db,
+    )
+    return candidate, True
+
+
+def _transition_pending(obj, **changes):
+    """
+    Move a pending request to its reviewed state with one guarded UPDATE.
+
+    The `status='pending'` filter makes concurrent approve/reject calls
+    race-free; on success the changes are mirrored onto `obj` for the
+    response. Returns whether the row was updated.
+    """
+    changes['updated_at'] = timezone.now()
+    updated = type(obj).objects.filter(pk=obj.pk, status='pending').update(**changes)
+    if updated:
+        for field, value in changes.items():
+            setattr(obj, field, value)
+    return bool(updated)
+
+
+def _org_access_cache(request):
+    cache = getattr(request, '_org_access_cache', None)
+    if cache is None:
+        cache = request._org_access_cache = {}
+    return cache
+
+
+# Organization columns the access helpers load, in concrete-field order as `Model.from_db` expects.
+_ACCESS_ORG_FIELDS = tuple(
+    field.attname
+    for field in Organization._meta.concrete_fields
+    if field.attname in {'id', 'name', 'slug', 'is_active'}
+)
 
-    if request.user.is_superuser:
+
+def _get_membership(request, org_id):
+    """
+    `(org, role)` of the request user's active membership in an active org, or None.
+
+    Memoized on the request. The role and org columns come back as one
+    `values_list` row, so no OrganizationMember instance is built.
+    """
+    cache = _org_access_cache(request)
+    key = ('membership', str(org_id))
+    if key not in cache:
+        row = OrganizationMember.objects.filter(
+            organization_id=org_id,
+            organization__is_active=True,
+            user=request.user,
+            status='active',
+        ).values_list('role', *(f'organization__{name}' for name in _ACCESS_ORG_FIELDS)).first()
+        if row is None:
+            cache[key] = None
+        else:
+            role, *org_values = row
+            cache[key] = (Organization.from_db(OrganizationMember.objects.db, _ACCESS_ORG_FIELDS, org_values), role)
+    return cache[key]
+
+
+def _route_org(request, org_id):
+    """The active org `OrgSlugResolutionMiddleware` already loaded for this route, if it is `org_id`."""
+    org = getattr(request, 'organization', None)
+    if org is not None and str(org.pk) == str(org_id):
         return org
+    return None
 
-    is_member = OrganizationMember.objects.filter(
-        organization=org,
-        user=request.user,
-        status='active',
-    ).exists()
-    if not is_member:
-        raise PermissionDenied('You do not have access to this organization.')
-    return org
+
+def ensure_org_access(request, org_id):
+    if request.user.is_superuser:
+        return get_org_or_404(request, org_id)
+    membership = _get_membership(request, org_id)
+    if membership:
+        return membership[0]
+    if _route_org(request, org_id) is None and not Organization.objects.filter(id=org_id, is_active=True).exists():
+        raise NotFound('Organization not found.')
+    raise PermissionDenied('You do not have access to this organization.')
 
 
 def ensure_org_admin_access(request, org_id):
-    org = Organization.objects.filter(id=org_id, is_active=True).first()
-    if not org:
-        raise NotFound('Organization not found.')
     if request.user.is_superuser:
-        return org
-    membership = OrganizationMember.objects.filter(
-        organization=org,
-        user=request.user,
-        status='active',
-    ).first()
-    if not membership:
-        raise PermissionDenied('You do not have access to this organization.')
-    if membership.role not in ['org_admin', 'ld_manager', 'super_admin']:
+        return get_org_or_404(request, org_id)
+    org = ensure_org_access(request, org_id)
+    _org, role = _get_membership(request, org_id)
+    if role not in ADMIN_ROLES:
         raise PermissionDenied('Org admin permissions are required.')
     return org
 
 
-def get_org_or_404(org_id):
-    org = Organization.objects.filter(id=org_id, is_active=True).first()
-    if not org:
+def get_org_or_404(request, org_id):
+    if not request.user.is_superuser:
+        membership = _get_membership(request, org_id)
+        if membership:
+            return membership[0]
+    cache = _org_access_cache(request)
+    key = ('org', str(org_id))
+    if key not in cache:
+        cache[key] = _route_org(request, org_id) or Organization.objects.only(*_ACCESS_ORG_FIELDS).filter(
+            id=org_id,
+            is_active=True,
+        ).first()
+    if not cache[key]:
         raise NotFound('Organization not found.')
-    return org
+    return cache[key]
 
 
-class OrganizationViewSet(viewsets.ModelViewSet):
+class OrganizationViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
+    queryset = Organization.objects.all()
     serializer_class = OrganizationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
+        queryset = super().get_queryset()
         if self.request.user.is_superuser:
-            return Organization.objects.filter(is_active=True).distinct()
-        return Organization.objects.filter(
-            members__user=self.request.user,
+            return queryset.filter(is_active=True)
+        return queryset.filter(
+            Exists(OrganizationMember.objects.filter(organization=OuterRef('pk'), user=self.request.user)),
             is_active=True,
-        ).distinct()
+        )
+
+    @staticmethod
+    def serialize_org_list_row(row):
+        """Build the `OrganizationSerializer` shape from a `.values()` row without DRF field dispatch."""
+        row['id'] = str(row['id'])
+        row['created_at'] = _datetime_field.to_representation(row['created_at'])
+        row['updated_at'] = _datetime_field.to_representation(row['updated_at'])
+        return row
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).values(*OrganizationSerializer.Meta.fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([self.serialize_org_list_row(row) for row in page])
+        return Response([self.serialize_org_list_row(row) for row in queryset])
 
     def perform_create(self, serializer):
         if not self.request.user.is_superuser:
             raise PermissionDenied('Only master users can create organizations directly.')
         org = serializer.save(created_by=self.request.user)
-        OrganizationMember.objects.get_or_create(
-            organization=org,
-            user=self.request.user,
-            defaults={'role': 'org_admin'},
-        )
+        ensure_member(org, self.request.user, role='org_admin')
         safe_create_audit_log(
             org_id=str(org.id),
             actor_id=str(self.request.user.id),
@@ -117,32 +255,37 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         )
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
+    queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         org_id = self.kwargs.get('organization_pk')
         ensure_org_access(self.request, org_id)
-        return Department.objects.filter(organization_id=org_id)
+        return super().get_queryset().filter(organization_id=org_id)
 
 
-class TeamViewSet(viewsets.ModelViewSet):
+class TeamViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
+    queryset = Team.objects.all()
     serializer_class = TeamSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         org_id = self.kwargs.get('organization_pk')
         ensure_org_access(self.request, org_id)
-        return Team.objects.filter(organization_id=org_id)
+        return super().get_queryset().filter(organization_id=org_id)
 
 
-class MyMembershipsView(generics.ListAPIView):
+class MyMembershipsView(AutoPrefetchMixin, generics.ListAPIView):
+    queryset = OrganizationMember.objects.all()
     serializer_class = OrganizationMemberDetailSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return OrganizationMember.objects.filter(user=self.request.user).select_related('organization', 'user')
+        return super().get_queryset().filter(
+            user=self.request.user
+        ).select_related('organization', 'user').only(*_member_detail_only_fields())
 
 
 class OrganizationMemberViewSet(viewsets.ModelViewSet):
@@ -154,7 +297,7 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
         ensure_org_access(self.request, org_id)
         return OrganizationMember.objects.filter(
             organization_id=org_id
-        ).select_related('organization', 'user')
+        ).select_related('organization', 'user').only(*_member_detail_only_fields())
 
     def create(self, request, *args, **kwargs):
         org_id = self.kwargs.get('organization_pk')
@@ -177,7 +320,7 @@ class MemberDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return OrganizationMember.objects.select_related('organization', 'user')
+        return OrganizationMember.objects.select_related('organization', 'user').only(*_member_detail_only_fields())
 
 
 class OrganizationRequestViewSet(viewsets.ModelViewSet):
@@ -204,17 +347,7 @@ class OrganizationRequestViewSet(viewsets.ModelViewSet):
         org_request = self.get_object()
         if org_request.status != 'pending':
             return Response({'error': 'Only pending requests can be approved.'}, status=status.HTTP_400_BAD_REQUEST)
-        existing_org = Organization.objects.filter(slug=org_request.slug, is_active=True).first()
-        if existing_org:
-            return Response(
-                {
-                    'error': 'Organization slug already exists.',
-                    'code': 'organization_slug_conflict',
-                    'existing_org_slug': existing_org.slug,
-                },
-                status=status.HTTP_409_CONFLICT,
-            )
-
+        # The unique slug constraint reports conflicts via IntegrityError below.
         try:
             with transaction.atomic():
                 org = Organization.objects.create(
@@ -224,11 +357,18 @@ class OrganizationRequestViewSet(viewsets.ModelViewSet):
                     plan=org_request.plan,
                     created_by=request.user,
                 )
-                OrganizationMember.objects.get_or_create(
-                    organization=org,
-                    user=org_request.requested_by,
-                    defaults={'role': 'org_admin', 'status': 'active'},
+                ensure_member(org, org_request.requested_by, role='org_admin')
+                approved = _transition_pending(
+                    org_request,
+                    status='approved',
+                    reviewed_by=request.user,
+                    reviewed_at=timezone.now(),
+                    created_org=org,
+                    review_note=request.data.get('review_note', org_request.review_note),
                 )
+                if not approved:
+                    transaction.set_rollback(True)
+                    return Response({'error': 'Only pending requests can be approved.'}, status=status.HTTP_400_BAD_REQUEST)
                 safe_create_audit_log(
                     org_id=str(org.id),
                     actor_id=str(request.user.id),
@@ -241,12 +381,6 @@ class OrganizationRequestViewSet(viewsets.ModelViewSet):
                     target_id=str(org.id),
                     target_name=org.name,
                 )
-                org_request.status = 'approved'
-                org_request.reviewed_by = request.user
-                org_request.reviewed_at = timezone.now()
-                org_request.created_org = org
-                org_request.review_note = request.data.get('review_note', org_request.review_note)
-                org_request.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'created_org', 'review_note', 'updated_at'])
         except IntegrityError:
             return Response(
                 {
@@ -266,11 +400,15 @@ class OrganizationRequestViewSet(viewsets.ModelViewSet):
         org_request = self.get_object()
         if org_request.status != 'pending':
             return Response({'error': 'Only pending requests can be rejected.'}, status=status.HTTP_400_BAD_REQUEST)
-        org_request.status = 'rejected'
-        org_request.reviewed_by = request.user
-        org_request.reviewed_at = timezone.now()
-        org_request.review_note = request.data.get('review_note', org_request.review_note)
-        org_request.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'review_note', 'updated_at'])
+        rejected = _transition_pending(
+            org_request,
+            status='rejected',
+            reviewed_by=request.user,
+            reviewed_at=timezone.now(),
+            review_note=request.data.get('review_note', org_request.review_note),
+        )
+        if not rejected:
+            return Response({'error': 'Only pending requests can be rejected.'}, status=status.HTTP_400_BAD_REQUEST)
         return Response(self.get_serializer(org_request).data)
 
 
@@ -281,13 +419,11 @@ class OrganizationJoinRequestViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         org_id = self.kwargs.get('organization_pk')
-        org = get_org_or_404(org_id)
-        is_admin = self.request.user.is_superuser or OrganizationMember.objects.filter(
-            organization=org,
-            user=self.request.user,
-            role__in=['org_admin', 'ld_manager', 'super_admin'],
-            status='active',
-        ).exists()
+        org = get_org_or_404(self.request, org_id)
+        membership = None if self.request.user.is_superuser else _get_membership(self.request, org_id)
+        is_admin = self.request.user.is_superuser or (
+            membership is not None and membership[1] in ADMIN_ROLES
+        )
         queryset = OrganizationJoinRequest.objects.filter(organization=org).select_related('requester', 'reviewed_by')
         if not is_admin:
             queryset = queryset.filter(requester=self.request.user)
@@ -295,12 +431,16 @@ class OrganizationJoinRequestViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         org_id = self.kwargs.get('organization_pk')
-        org = get_org_or_404(org_id)
-        membership_exists = OrganizationMember.objects.filter(
-            organization=org,
-            user=self.request.user,
-            status='active',
-        ).exists()
+        org = get_org_or_404(self.request, org_id)
+        if self.request.user.is_superuser:
+            # Superusers skip the cached membership lookup.
+            membership_exists = OrganizationMember.objects.filter(
+                organization=org,
+                user=self.request.user,
+                status='active',
+            ).exists()
+        else:
+            membership_exists = _get_membership(self.request, org_id) is not None
         if membership_exists:
             raise PermissionDenied('You are already a member of this organization.')
         existing_pending = OrganizationJoinRequest.objects.filter(
@@ -318,11 +458,16 @@ class OrganizationJoinRequestViewSet(viewsets.ModelViewSet):
         join_request = self.get_object()
         if join_request.status != 'pending':
             return Response({'error': 'Only pending requests can be approved.'}, status=status.HTTP_400_BAD_REQUEST)
-        OrganizationMember.objects.get_or_create(
-            organization=org,
-            user=join_request.requester,
-            defaults={'role': 'learner', 'status': 'active'},
-        )
+        with transaction.atomic():
+            approved = _transition_pending(
+                join_request,
+                status='approved',
+                reviewed_by=request.user,
+                reviewed_at=timezone.now(),
+            )
+            if not approved:
+                return Response({'error': 'Only pending requests can be approved.'}, status=status.HTTP_400_BAD_REQUEST)
+            ensure_member(org, join_request.requester, role='learner')
         safe_create_audit_log(
             org_id=str(org.id),
             actor_id=str(request.user.id),
@@ -335,10 +480,6 @@ class OrganizationJoinRequestViewSet(viewsets.ModelViewSet):
             target_id=str(join_request.requester_id),
             target_name=join_request.requester.email,
         )
-        join_request.status = 'approved'
-        join_request.reviewed_by = request.user
-        join_request.reviewed_at = timezone.now()
-        join_request.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'updated_at'])
         return Response(self.get_serializer(join_request).data)
 
     @action(detail=True, methods=['post'], url_path='reject')
@@ -347,10 +488,14 @@ class OrganizationJoinRequestViewSet(viewsets.ModelViewSet):
         join_request = self.get_object()
         if join_request.status != 'pending':
             return Response({'error': 'Only pending requests can be rejected.'}, status=status.HTTP_400_BAD_REQUEST)
-        join_request.status = 'rejected'
-        join_request.reviewed_by = request.user
-        join_request.reviewed_at = timezone.now()
-        join_request.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'updated_at'])
+        rejected = _transition_pending(
+            join_request,
+            status='rejected',
+            reviewed_by=request.user,
+            reviewed_at=timezone.now(),
+        )
+        if not rejected:
+            return Response({'error': 'Only pending requests can be rejected.'}, status=status.HTTP_400_BAD_REQUEST)
         safe_create_audit_log(
             org_id=str(org.id),
             actor_id=str(request.user.id),
@@ -380,7 +525,7 @@ class OrganizationInviteCodeViewSet(viewsets.ModelViewSet):
         org_id = self.kwargs.get('organization_pk')
         org = ensure_org_admin_access(self.request, org_id)
         provided_code = self.request.data.get('code')
-        code = (provided_code or secrets.token_urlsafe(8)).replace('-', '').replace('_', '')[:20].upper()
+        code = (provided_code or secrets.token_urlsafe(8)).translate(_INVITE_CODE_STRIP)[:20].upper()
         invite = serializer.save(organization=org, created_by=self.request.user, code=code, is_active=True)
         safe_create_audit_log(
             org_id=str(org.id),
@@ -395,6 +540,41 @@ class OrganizationInviteCodeViewSet(viewsets.ModelViewSet):
             target_name=invite.code,
         )
 
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request, organization_pk=None):
+        org = ensure_org_admin_access(request, organization_pk)
+        try:
+            count = int(request.data.get('count', 0))
+        except (TypeError, ValueError):
+            count = 0
+        if not 1 <= count <= MAX_BULK_INVITE_CODES:
+            return Response(
+                {'error': f'count must be between 1 and {MAX_BULK_INVITE_CODES}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        invites = OrganizationInviteCode.objects.bulk_create([
+            OrganizationInviteCode(
+                organization=org,
+                created_by=request.user,
+                code=code,
+                **{**serializer.validated_data, 'is_active': True},
+            )
+            for code in generate_invite_codes(count)
+        ])
+        safe_create_audit_log(
+            org_id=str(org.id),
+            actor_id=str(request.user.id),
+            actor_name=request.user.email,
+            actor_type='admin',
+            action='invite_code.bulk_created',
+            entity_type='organization_invite_code',
+            target_type='invite_code',
+            metadata={'codes': [invite.code for invite in invites]},
+        )
+        return Response(self.get_serializer(invites, many=True).data, status=status.HTTP_201_CREATED)
+
 
 class InviteCodeRedeemView(generics.GenericAPIView):
     permission_classes = [IsAuthenticated]
@@ -404,26 +584,33 @@ class InviteCodeRedeemView(generics.GenericAPIView):
         if not code:
             return Response({'error': 'Invite code is required.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        invite = OrganizationInviteCode.objects.filter(code=code, is_active=True).select_related('organization').first()
-        if not invite:
-            return Response({'error': 'Invite code is invalid or inactive.'}, status=status.HTTP_404_NOT_FOUND)
-
-        now = timezone.now()
-        if invite.expires_at and invite.expires_at < now:
-            return Response({'error': 'Invite code has expired.'}, status=status.HTTP_400_BAD_REQUEST)
-        if invite.max_uses is not None and invite.used_count >= invite.max_uses:
-            return Response({'error': 'Invite code usage limit has been reached.'}, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            # Lock the invite row only, not the joined organization.
+            invite = OrganizationInviteCode.objects.select_for_update(of=('self',)).filter(
+                code=code,
+                is_active=True,
+            ).select_related('organization').first()
+            if not invite:
+                return Response({'error': 'Invite code is invalid or inactive.'}, status=status.HTTP_404_NOT_FOUND)
+
+            now = timezone.now()
+            if invite.expires_at and invite.expires_at < now:
+                return Response({'error': 'Invite code has expired.'}, status=status.HTTP_400_BAD_REQUEST)
+            if invite.max_uses is not None and invite.used_count >= invite.max_uses:
+                return Response({'error': 'Invite code usage limit has been reached.'}, status=status.HTTP_400_BAD_REQUEST)
+
+            member, created = ensure_member(invite.organization, request.user, role=invite.role)
+            if created:
+                OrganizationInviteCode.objects.filter(pk=invite.pk).update(
+                    used_count=F('used_count') + 1,
+                    is_active=Case(
+                        When(max_uses__isnull=False, max_uses__lte=F('used_count') + 1, then=Value(False)),
+                        default=F('is_active'),
+                    ),
+                    updated_at=now,
+                )
 
-        member, created = OrganizationMember.objects.get_or_create(
-            organization=invite.organization,
-            user=request.user,
-            defaults={'role': invite.role, 'status': 'active'},
-        )
         if created:
-            invite.used_count += 1
-            if invite.max_uses is not None and invite.used_count >= invite.max_uses:
-                invite.is_active = False
-            invite.save(update_fields=['used_count', 'is_active', 'updated_at'])
             safe_create_audit_log(
                 org_id=str(invite.organization_id),
                 actor_id=str(request.user.id),
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.2 on 2026-10-16
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def percent_to_basis_points(apps, schema_editor):
+    for model_name in ('ProgressRecord', 'ModuleProgress'):
+        model = apps.get_model('progress', model_name)
+        model.objects.update(completion_percentage=F('completion_percentage') * 100)
+
+
+def basis_points_to_percent(apps, schema_editor):
+    for model_name in ('ProgressRecord', 'ModuleProgress'):
+        model = apps.get_model('progress', model_name)
+        model.objects.update(completion_percentage=F('completion_percentage') / 100.0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('progress', '0001_initial'),
+    ]
+
+    operations = [
+        # Widen first so 100.00 * 100 fits before narrowing to an integer.
+        migrations.AlterField(
+            model_name='progressrecord',
+            name='completion_percentage',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='moduleprogress',
+            name='completion_percentage',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=7),
+        ),
+        migrations.RunPython(percent_to_basis_points, basis_points_to_percent),
+        migrations.AlterField(
+            model_name='progressrecord',
+            name='completion_percentage',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Completion in basis points (10000 = 100.00%)'),
+        ),
+        migrations.AlterField(
+            model_name='moduleprogress',
+            name='completion_percentage',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Completion in basis points (10000 = 100.00%)'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.0.2 on 2026-10-16
+
+import uuid
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def _as_uuid(value):
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def backfill_typed_columns(apps, schema_editor):
+    ProgressEvent = apps.get_model('progress', 'ProgressEvent')
+    events = (
+        ProgressEvent.objects
+        .filter(models.Q(data__has_key='lesson_id') | models.Q(data__has_key='duration_seconds'))
+        .only('id', 'data')
+    )
+    batch = []
+    for event in events.iterator(chunk_size=BATCH_SIZE):
+        event.lesson_id = _as_uuid(event.data.get('lesson_id'))
+        event.duration_seconds = _as_int(event.data.get('duration_seconds'))
+        batch.append(event)
+        if len(batch) >= BATCH_SIZE:
+            ProgressEvent.objects.bulk_update(batch, ['lesson_id', 'duration_seconds'])
+            batch = []
+    if batch:
+        ProgressEvent.objects.bulk_update(batch, ['lesson_id', 'duration_seconds'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('progress', '0002_completion_percentage_basis_points'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progressevent',
+            name='lesson_id',
+            field=models.UUIDField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='progressevent',
+            name='duration_seconds',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_typed_columns, migrations.RunPython.noop),
+    ]
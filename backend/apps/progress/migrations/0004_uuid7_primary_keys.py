@@ -0,0 +1,36 @@
+# Generated by Django 5.0.2 on 2026-10-16
+
+from django.db import migrations, models
+
+import tuutta_backend.ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('progress', '0003_progressevent_typed_columns'),
+    ]
+
+    operations = [
+        # Highest-volume table first.
+        migrations.AlterField(
+            model_name='progressevent',
+            name='id',
+            field=models.UUIDField(default=tuutta_backend.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='lessonprogress',
+            name='id',
+            field=models.UUIDField(default=tuutta_backend.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='moduleprogress',
+            name='id',
+            field=models.UUIDField(default=tuutta_backend.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='progressrecord',
+            name='id',
+            field=models.UUIDField(default=tuutta_backend.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -2,16 +2,39 @@ from django.db import models
 from apps.accounts.models import User
 from apps.courses.models import Course, CourseModule, Lesson
 from apps.enrollments.models import Enrollment
-import uuid
+from tuutta_backend.ids import uuid7
+
+
+class ProgressRecordQuerySet(models.QuerySet):
+    def with_nested(self):
+        """Prefetch the module/lesson progress rows `ProgressRecordSerializer` nests, narrowed to its fields."""
+        return self.prefetch_related(
+            models.Prefetch(
+                'module_progress',
+                queryset=ModuleProgress.objects.only(
+                    'id', 'progress_record_id', 'module_id', 'status', 'completion_percentage',
+                    'started_at', 'completed_at', 'time_spent',
+                ),
+            ),
+            models.Prefetch(
+                'lesson_progress',
+                queryset=LessonProgress.objects.only(
+                    'id', 'progress_record_id', 'lesson_id', 'status',
+                    'started_at', 'completed_at', 'time_spent', 'last_position',
+                ),
+            ),
+        )
 
 
 class ProgressRecord(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='progress_records')
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='progress_records')
     enrollment = models.ForeignKey(Enrollment, on_delete=models.SET_NULL, null=True, blank=True)
 
-    completion_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    completion_percentage = models.PositiveSmallIntegerField(
+        default=0, help_text='Completion in basis points (10000 = 100.00%)',
+    )
     total_time_spent = models.IntegerField(default=0)  # seconds
     last_accessed_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
@@ -19,6 +42,8 @@ class ProgressRecord(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProgressRecordQuerySet.as_manager()
+
     class Meta:
         db_table = 'progress_records'
         unique_together = ['user', 'course']
@@ -31,12 +56,14 @@ class ModuleProgress(models.Model):
         ('completed', 'Completed'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     progress_record = models.ForeignKey(ProgressRecord, on_delete=models.CASCADE, related_name='module_progress')
     module = models.ForeignKey(CourseModule, on_delete=models.CASCADE)
 
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='not_started')
-    completion_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    completion_percentage = models.PositiveSmallIntegerField(
+        default=0, help_text='Completion in basis points (10000 = 100.00%)',
+    )
 
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
@@ -55,7 +82,7 @@ class LessonProgress(models.Model):
         ('completed', 'Completed'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     progress_record = models.ForeignKey(ProgressRecord, on_delete=models.CASCADE, related_name='lesson_progress')
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE)
 
@@ -74,11 +101,14 @@ class LessonProgress(models.Model):
 
 
 class ProgressEvent(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     course = models.ForeignKey(Course, on_delete=models.SET_NULL, null=True, blank=True)
 
     event_type = models.CharField(max_length=50)
+    # Hot keys promoted out of `data`; the long tail stays in JSON.
+    lesson_id = models.UUIDField(null=True, blank=True, db_index=True)
+    duration_seconds = models.IntegerField(null=True, blank=True)
     data = models.JSONField(default=dict)
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1,24 +1,47 @@
 from rest_framework import serializers
+
+from tuutta_backend.serializers import CachedFieldsModelSerializer
 from .models import ProgressRecord, ModuleProgress, LessonProgress, ProgressEvent
 
 
-class LessonProgressSerializer(serializers.ModelSerializer):
+class BasisPointsPercentField(serializers.DecimalField):
+    """Percentage stored as integer basis points but exchanged as a 2-dp decimal string (`"75.00"`)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(max_digits=5, decimal_places=2, **kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if value < 0:
+            self.fail('min_value', min_value=0)
+        if value > 100:
+            self.fail('max_value', max_value=100)
+        return int(value * 100)
+
+    def to_representation(self, value):
+        return '%d.%02d' % divmod(value, 100)
+
+
+class LessonProgressSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = LessonProgress
         fields = ['id', 'lesson', 'status', 'started_at', 'completed_at', 'time_spent', 'last_position']
         read_only_fields = ['id']
 
 
-class ModuleProgressSerializer(serializers.ModelSerializer):
+class ModuleProgressSerializer(CachedFieldsModelSerializer):
+    completion_percentage = BasisPointsPercentField(required=False)
+
     class Meta:
         model = ModuleProgress
         fields = ['id', 'module', 'status', 'completion_percentage', 'started_at', 'completed_at', 'time_spent']
         read_only_fields = ['id']
 
 
-class ProgressRecordSerializer(serializers.ModelSerializer):
+class ProgressRecordSerializer(CachedFieldsModelSerializer):
     module_progress = ModuleProgressSerializer(many=True, read_only=True)
     lesson_progress = LessonProgressSerializer(many=True, read_only=True)
+    completion_percentage = BasisPointsPercentField(required=False)
 
     class Meta:
         model = ProgressRecord
@@ -1,5 +1,7 @@
 """API tests for the progress endpoints."""
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
@@ -16,45 +18,63 @@ def api_client():
     return APIClient()
 
 
-@pytest.fixture
-def user(db):
-    return User.objects.create_user(
-        username="learner@example.com",
-        email="learner@example.com",
-        password="LearnPass1!",
-    )
-
-
-@pytest.fixture
-def other_user(db):
-    return User.objects.create_user(
-        username="other@example.com",
-        email="other@example.com",
-        password="OtherPass1!",
-    )
-
-
-@pytest.fixture
-def organization(db, user):
-    org = Organization.objects.create(
-        name="Test Org",
-        slug="test-org",
-        plan="professional",
-        created_by=user,
-    )
-    OrganizationMember.objects.create(organization=org, user=user, role="learner")
-    return org
-
-
-@pytest.fixture
-def course(db, organization, user):
-    return Course.objects.create(
-        title="Test Course",
-        description="desc",
-        organization=organization,
-        created_by=user,
-        status="published",
-    )
+# The user/organization/course rows are read-only in these tests, so they are
+# created once per module (committed outside the per-test transaction) and
+# removed at teardown. Rows tests mutate stay function-scoped below.
+@pytest.fixture(scope="module")
+def user(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        user = User.objects.create_user(
+            username="learner@example.com",
+            email="learner@example.com",
+            password="LearnPass1!",
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture(scope="module")
+def other_user(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        other_user = User.objects.create_user(
+            username="other@example.com",
+            email="other@example.com",
+            password="OtherPass1!",
+        )
+    yield other_user
+    with django_db_blocker.unblock():
+        other_user.delete()
+
+
+@pytest.fixture(scope="module")
+def organization(django_db_blocker, user):
+    with django_db_blocker.unblock():
+        org = Organization.objects.create(
+            name="Test Org",
+            slug="test-org",
+            plan="professional",
+            created_by=user,
+        )
+        OrganizationMember.objects.create(organization=org, user=user, role="learner")
+    yield org
+    with django_db_blocker.unblock():
+        org.delete()
+
+
+@pytest.fixture(scope="module")
+def course(django_db_blocker, organization, user):
+    with django_db_blocker.unblock():
+        course = Course.objects.create(
+            title="Test Course",
+            description="desc",
+            organization=organization,
+            created_by=user,
+            status="published",
+        )
+    yield course
+    with django_db_blocker.unblock():
+        course.delete()
 
 
 @pytest.fixture
@@ -73,32 +93,20 @@ def progress_record(db, user, course, enrollment):
         user=user,
         course=course,
         enrollment=enrollment,
-        completion_percentage=25,
+        completion_percentage=2500,
         total_time_spent=300,
     )
 
 
 @pytest.fixture
 def auth_client(api_client, user):
-    resp = api_client.post(
-        reverse("login"),
-        {"email": "learner@example.com", "password": "LearnPass1!"},
-        format="json",
-    )
-    token = resp.data.get("access")
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    api_client.force_authenticate(user=user)
     return api_client
 
 
 @pytest.fixture
 def other_auth_client(api_client, other_user):
-    resp = api_client.post(
-        reverse("login"),
-        {"email": "other@example.com", "password": "OtherPass1!"},
-        format="json",
-    )
-    token = resp.data.get("access")
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    api_client.force_authenticate(user=other_user)
     return api_client
 
 
@@ -121,6 +129,23 @@ class TestProgressViewSet:
         ids = [p["id"] for p in (items or [])]
         assert str(progress_record.id) not in ids
 
+    def test_list_query_count_independent_of_rows(self, auth_client, user, organization, progress_record):
+        with CaptureQueriesContext(connection) as single:
+            auth_client.get(reverse("progress-list"))
+        for i in range(3):
+            extra_course = Course.objects.create(
+                title=f"Extra Course {i}",
+                description="desc",
+                organization=organization,
+                created_by=user,
+                status="published",
+            )
+            ProgressRecord.objects.create(user=user, course=extra_course)
+        with CaptureQueriesContext(connection) as many:
+            resp = auth_client.get(reverse("progress-list"))
+        assert resp.status_code == 200
+        assert len(many.captured_queries) == len(single.captured_queries)
+
     def test_retrieve_progress_record(self, auth_client, progress_record):
         resp = auth_client.get(reverse("progress-detail", kwargs={"pk": str(progress_record.id)}))
         assert resp.status_code == 200
@@ -148,7 +173,9 @@ class TestProgressViewSet:
             format="json",
         )
         assert resp.status_code == 200
-        assert float(resp.data["completion_percentage"]) == 75.0
+        assert resp.data["completion_percentage"] == "75.00"
+        progress_record.refresh_from_db()
+        assert progress_record.completion_percentage == 7500
 
     def test_delete_progress_record(self, auth_client, progress_record):
         resp = auth_client.delete(reverse("progress-detail", kwargs={"pk": str(progress_record.id)}))
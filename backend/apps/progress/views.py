@@ -8,4 +8,4 @@ class ProgressViewSet(viewsets.ModelViewSet):
     ordering = ['-updated_at']
 
     def get_queryset(self):
-        return ProgressRecord.objects.filter(user=self.request.user)
+        return ProgressRecord.objects.filter(user=self.request.user).with_nested()
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webhooks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookendpoint',
+            name='batch_mode',
+            field=models.BooleanField(default=False),
+        ),
+    ]
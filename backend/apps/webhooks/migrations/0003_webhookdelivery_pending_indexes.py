@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webhooks', '0002_webhookendpoint_batch_mode'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='webhookdelivery',
+            name='webhook_del_status_269a2c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='webhookdelivery',
+            name='webhook_del_created_50111d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='webhookdelivery',
+            index=models.Index(fields=['status', 'created_at'], name='whd_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookdelivery',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['created_at'], name='whd_pending_idx'),
+        ),
+    ]
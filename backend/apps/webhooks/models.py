@@ -20,6 +20,8 @@ class WebhookEndpoint(models.Model):
     # Optional allow-list of event names; empty = all events
     events = models.JSONField(default=list, blank=True)
     headers = models.JSONField(default=dict, blank=True)
+    # Receive pending deliveries as one signed `{"deliveries": [...]}` POST
+    batch_mode = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -35,6 +37,7 @@ class WebhookEndpoint(models.Model):
 class WebhookDelivery(models.Model):
     STATUSES = [
         ('pending', 'Pending'),
+        ('in_flight', 'In flight'),
         ('sent', 'Sent'),
         ('failed', 'Failed'),
     ]
@@ -51,10 +54,12 @@ class WebhookDelivery(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
     delivered_at = models.DateTimeField(null=True, blank=True)
+    # Set when a worker moves the row to in_flight; used to reclaim rows whose worker died
+    claimed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = 'webhook_deliveries'
         indexes = [
-            models.Index(fields=['status']),
-            models.Index(fields=['created_at']),
+            models.Index(fields=['status', 'created_at'], name='whd_status_created_idx'),
+            models.Index(fields=['created_at'], condition=models.Q(status='pending'), name='whd_pending_idx'),
         ]
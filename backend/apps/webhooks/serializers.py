@@ -7,7 +7,7 @@ class WebhookEndpointSerializer(serializers.ModelSerializer):
         model = WebhookEndpoint
         fields = [
             'id', 'organization', 'name', 'url', 'is_active', 'secret',
-            'events', 'headers', 'created_at', 'updated_at', 'last_delivered_at'
+            'events', 'headers', 'batch_mode', 'created_at', 'updated_at', 'last_delivered_at'
         ]
         read_only_fields = ['secret', 'created_at', 'updated_at', 'last_delivered_at']
 
@@ -20,3 +20,10 @@ class WebhookDeliverySerializer(serializers.ModelSerializer):
             'attempt_count', 'http_status', 'error_message',
             'created_at', 'delivered_at'
         ]
+
+
+class WebhookDeliveryListSerializer(WebhookDeliverySerializer):
+    """Lightweight list serializer — excludes the delivery payload."""
+
+    class Meta(WebhookDeliverySerializer.Meta):
+        fields = [f for f in WebhookDeliverySerializer.Meta.fields if f != 'payload']
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import WebhookEndpoint
+from .services import invalidate_subscriber_cache
+
+
+@receiver(post_save, sender=WebhookEndpoint)
+@receiver(post_delete, sender=WebhookEndpoint)
+def handle_endpoint_changed(sender, instance: WebhookEndpoint, **kwargs):
+    invalidate_subscriber_cache(str(instance.organization_id))
@@ -1,22 +1,95 @@
-from celery import shared_task
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+from typing import List
+
+from celery import group, shared_task
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
 from .models import WebhookDelivery
-from .services import deliver_webhook
+from .services import (
+    MAX_BATCH_SIZE, deliver_webhook, deliver_webhook_batch, save_delivery_results, send_delivery,
+)
+
+MAX_DISPATCH_WORKERS = 16
+# Longer than a whole dispatch run can take (50 sequential 10s POSTs to one
+# endpoint), so a row still in flight after this has lost its worker.
+IN_FLIGHT_TIMEOUT = timedelta(minutes=15)
 
 
 @shared_task
 def deliver_webhook_task(delivery_id: str) -> None:
-    try:
-        delivery = WebhookDelivery.objects.select_related('endpoint').get(id=delivery_id)
-    except WebhookDelivery.DoesNotExist:
-        return
-    if delivery.status != 'pending':
+    # Claim the row first so a concurrent dispatch run cannot send it too.
+    claimed = WebhookDelivery.objects.filter(id=delivery_id, status='pending').update(
+        status='in_flight', claimed_at=timezone.now(),
+    )
+    if not claimed:
         return
+    delivery = WebhookDelivery.objects.select_related('endpoint').get(id=delivery_id)
     deliver_webhook(delivery)
 
 
+def queue_deliveries(deliveries: List[WebhookDelivery]) -> None:
+    """Enqueue `deliver_webhook_task` for `deliveries` in one broker call once their rows are committed."""
+    delivery_ids = [str(delivery.id) for delivery in deliveries]
+    if delivery_ids:
+        transaction.on_commit(
+            lambda: group(deliver_webhook_task.s(delivery_id) for delivery_id in delivery_ids).apply_async()
+        )
+
+
+def _deliver_endpoint_group(deliveries: List[WebhookDelivery]) -> List[WebhookDelivery]:
+    # Runs on a worker thread: deliveries to one endpoint stay in order, and
+    # the thread's own DB connection is closed once it is done. Returns the
+    # individually sent deliveries, whose outcomes are still unsaved.
+    try:
+        if deliveries[0].endpoint.batch_mode:
+            for start in range(0, len(deliveries), MAX_BATCH_SIZE):
+                deliver_webhook_batch(deliveries[start:start + MAX_BATCH_SIZE])
+            return []
+        for delivery in deliveries:
+            send_delivery(delivery)
+        return deliveries
+    finally:
+        connections.close_all()
+
+
+def reclaim_stale_deliveries() -> int:
+    """Return deliveries stuck in flight past `IN_FLIGHT_TIMEOUT` to pending so they are sent again."""
+    # Rows claimed before `claimed_at` existed have no claim time and are reclaimed too.
+    return WebhookDelivery.objects.filter(
+        Q(claimed_at__lt=timezone.now() - IN_FLIGHT_TIMEOUT) | Q(claimed_at__isnull=True),
+        status='in_flight',
+    ).update(status='pending', claimed_at=None)
+
+
 @shared_task
 def dispatch_pending_webhooks(limit: int = 50) -> int:
-    pending = WebhookDelivery.objects.select_related('endpoint').filter(status='pending')[:limit]
+    reclaim_stale_deliveries()
+    # Claim a batch with FOR UPDATE SKIP LOCKED so concurrent runs take
+    # disjoint rows, then mark it in flight before any POST goes out.
+    with transaction.atomic():
+        pending = list(
+            WebhookDelivery.objects.select_for_update(skip_locked=True, of=('self',))
+            .select_related('endpoint')
+            .filter(status='pending')
+            .order_by('created_at')[:limit]
+        )
+        WebhookDelivery.objects.filter(id__in=[d.id for d in pending]).update(
+            status='in_flight', claimed_at=timezone.now(),
+        )
     for delivery in pending:
-        deliver_webhook(delivery)
-    return pending.count()
+        delivery.status = 'in_flight'
+    by_endpoint = sorted(pending, key=attrgetter('endpoint_id'))
+    endpoint_deliveries = [list(rows) for _, rows in groupby(by_endpoint, key=attrgetter('endpoint_id'))]
+    if endpoint_deliveries:
+        with ThreadPoolExecutor(max_workers=min(MAX_DISPATCH_WORKERS, len(endpoint_deliveries))) as executor:
+            sent = [
+                delivery
+                for deliveries in executor.map(_deliver_endpoint_group, endpoint_deliveries)
+                for delivery in deliveries
+            ]
+        save_delivery_results(sent)
+    return len(by_endpoint)
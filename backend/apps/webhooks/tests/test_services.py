@@ -0,0 +1,90 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from apps.organizations.models import Organization
+from apps.webhooks.models import WebhookEndpoint
+from apps.webhooks.services import (
+    _build_signature, _canonical_json, enqueue_event, invalidate_subscriber_cache, verify_signature,
+)
+
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def organization(db):
+    owner = User.objects.create_user(
+        username='subscriber-owner@test.com',
+        email='subscriber-owner@test.com',
+        password='OwnerPass1!',
+    )
+    return Organization.objects.create(name='Subscriber Org', slug='subscriber-org', created_by=owner)
+
+
+def test_endpoint_save_invalidates_unsubscribed_answer(organization, django_assert_num_queries):
+    assert enqueue_event(organization.id, 'course.published', {}) == []
+    with django_assert_num_queries(0):
+        assert enqueue_event(organization.id, 'course.published', {}) == []
+
+    WebhookEndpoint.objects.create(organization=organization, url='https://example.com/hook')
+
+    assert len(enqueue_event(organization.id, 'course.published', {})) == 1
+
+
+def test_endpoint_update_invalidates_unsubscribed_answer(organization):
+    endpoint = WebhookEndpoint.objects.create(
+        organization=organization, url='https://example.com/hook', events=['course.archived'],
+    )
+    assert enqueue_event(organization.id, 'course.published', {}) == []
+
+    endpoint.events = []
+    endpoint.save()
+
+    assert len(enqueue_event(organization.id, 'course.published', {})) == 1
+
+
+def test_queryset_update_is_stale_until_invalidated(organization):
+    # .update() skips post_save, so the negative answer outlives the change
+    # until the TTL expires or the version is bumped explicitly.
+    endpoint = WebhookEndpoint.objects.create(
+        organization=organization, url='https://example.com/hook', is_active=False,
+    )
+    assert enqueue_event(organization.id, 'course.published', {}) == []
+
+    WebhookEndpoint.objects.filter(id=endpoint.id).update(is_active=True)
+    assert enqueue_event(organization.id, 'course.published', {}) == []
+
+    invalidate_subscriber_cache(str(organization.id))
+    assert len(enqueue_event(organization.id, 'course.published', {})) == 1
+
+
+SECRET = 'a' * 48
+TIMESTAMP = '1760000000'
+BODY = _canonical_json({'event': 'course.published', 'data': {'id': 1}})
+
+
+def test_verify_signature_accepts_own_signature():
+    assert verify_signature(SECRET, TIMESTAMP, BODY, _build_signature(SECRET, TIMESTAMP, BODY))
+
+
+def test_verify_signature_rejects_tampered_body():
+    signature = _build_signature(SECRET, TIMESTAMP, BODY)
+    assert not verify_signature(SECRET, TIMESTAMP, BODY.replace(b'1', b'2'), signature)
+
+
+def test_verify_signature_rejects_wrong_timestamp():
+    signature = _build_signature(SECRET, TIMESTAMP, BODY)
+    assert not verify_signature(SECRET, '1760000001', BODY, signature)
+
+
+@pytest.mark.parametrize('signature', ['', 'v1=abc', 'v1=' + 'é' * 64, 'v1=\u2603'])
+def test_verify_signature_rejects_malformed_signature(signature):
+    assert verify_signature(SECRET, TIMESTAMP, BODY, signature) is False
@@ -0,0 +1,160 @@
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.utils import timezone
+
+from apps.organizations.models import Organization
+from apps.webhooks.models import WebhookDelivery, WebhookEndpoint
+from apps.webhooks.services import BATCH_DELIVERY_TIMEOUT, MAX_BATCH_SIZE, _build_signature, _canonical_json
+from apps.webhooks.tasks import (
+    IN_FLIGHT_TIMEOUT, _deliver_endpoint_group, dispatch_pending_webhooks, reclaim_stale_deliveries,
+)
+
+
+User = get_user_model()
+
+
+@pytest.fixture
+def endpoint(db):
+    owner = User.objects.create_user(
+        username='webhook-owner@test.com',
+        email='webhook-owner@test.com',
+        password='OwnerPass1!',
+    )
+    organization = Organization.objects.create(name='Webhook Org', slug='webhook-org', created_by=owner)
+    return WebhookEndpoint.objects.create(organization=organization, url='https://example.com/hook')
+
+
+def _delivery(endpoint, status, claimed_at=None):
+    return WebhookDelivery.objects.create(
+        endpoint=endpoint, event='course.published', status=status, claimed_at=claimed_at,
+    )
+
+
+def test_reclaim_resets_only_stale_in_flight_deliveries(endpoint):
+    now = timezone.now()
+    stale = _delivery(endpoint, 'in_flight', claimed_at=now - IN_FLIGHT_TIMEOUT - timedelta(minutes=1))
+    unclaimed = _delivery(endpoint, 'in_flight')
+    fresh = _delivery(endpoint, 'in_flight', claimed_at=now)
+    sent = _delivery(endpoint, 'sent', claimed_at=now - IN_FLIGHT_TIMEOUT * 2)
+
+    assert reclaim_stale_deliveries() == 2
+
+    for delivery in (stale, unclaimed, fresh, sent):
+        delivery.refresh_from_db()
+    assert stale.status == 'pending'
+    assert stale.claimed_at is None
+    assert unclaimed.status == 'pending'
+    assert fresh.status == 'in_flight'
+    assert sent.status == 'sent'
+
+
+def test_dispatch_resends_reclaimed_deliveries(endpoint, monkeypatch):
+    stale = _delivery(endpoint, 'in_flight', claimed_at=timezone.now() - IN_FLIGHT_TIMEOUT * 2)
+    sent_ids = []
+
+    def fake_send(delivery):
+        sent_ids.append(delivery.id)
+        delivery.status = 'sent'
+        delivery.attempt_count += 1
+
+    monkeypatch.setattr('apps.webhooks.tasks.send_delivery', fake_send)
+
+    assert dispatch_pending_webhooks() == 1
+    assert sent_ids == [stale.id]
+    stale.refresh_from_db()
+    assert stale.status == 'sent'
+
+
+class FakeSession:
+    def __init__(self, status_code=200, exc=None):
+        self.status_code = status_code
+        self.exc = exc
+        self.calls = []
+
+    def post(self, url, data, headers, timeout):
+        self.calls.append({'url': url, 'data': data, 'headers': headers, 'timeout': timeout})
+        if self.exc is not None:
+            raise self.exc
+        return SimpleNamespace(status_code=self.status_code)
+
+
+@pytest.fixture
+def batch_deliveries(endpoint, monkeypatch):
+    # The worker-thread cleanup would close the test's own connection here.
+    monkeypatch.setattr(connections, 'close_all', lambda: None)
+    endpoint.batch_mode = True
+    endpoint.save()
+    WebhookDelivery.objects.bulk_create(
+        WebhookDelivery(endpoint=endpoint, event='course.published', payload={'n': n}, status='in_flight')
+        for n in range(120)
+    )
+    return list(WebhookDelivery.objects.select_related('endpoint').order_by('created_at', 'id'))
+
+
+def _deliver(deliveries, session, monkeypatch):
+    monkeypatch.setattr('apps.webhooks.services._SESSION', session)
+    assert _deliver_endpoint_group(deliveries) == []
+
+
+def test_batch_mode_posts_one_signed_request_per_chunk(batch_deliveries, monkeypatch):
+    session = FakeSession()
+    _deliver(batch_deliveries, session, monkeypatch)
+
+    assert [len(json.loads(call['data'])['deliveries']) for call in session.calls] == [
+        MAX_BATCH_SIZE, MAX_BATCH_SIZE, 120 - 2 * MAX_BATCH_SIZE,
+    ]
+    secret = batch_deliveries[0].endpoint.secret
+    for start, call in zip(range(0, 120, MAX_BATCH_SIZE), session.calls):
+        chunk = batch_deliveries[start:start + MAX_BATCH_SIZE]
+        body = _canonical_json({
+            'deliveries': [
+                {
+                    'id': str(delivery.id),
+                    'event': delivery.event,
+                    'data': delivery.payload,
+                    'created_at': delivery.created_at.isoformat(),
+                }
+                for delivery in chunk
+            ]
+        })
+        headers = call['headers']
+        assert call['data'] == body
+        assert call['timeout'] == BATCH_DELIVERY_TIMEOUT
+        assert headers[settings.WEBHOOK_EVENT_HEADER] == 'batch'
+        assert headers[settings.WEBHOOK_SIGNATURE_HEADER] == _build_signature(
+            secret, headers[settings.WEBHOOK_TIMESTAMP_HEADER], body,
+        )
+
+
+def test_batch_mode_marks_every_row_sent_on_2xx(batch_deliveries, monkeypatch):
+    _deliver(batch_deliveries, FakeSession(status_code=202), monkeypatch)
+
+    rows = WebhookDelivery.objects.all()
+    assert {(row.status, row.attempt_count, row.http_status) for row in rows} == {('sent', 1, 202)}
+    assert all(row.delivered_at is not None for row in rows)
+    assert WebhookEndpoint.objects.get().last_delivered_at is not None
+
+
+def test_batch_mode_marks_every_row_failed_on_non_2xx(batch_deliveries, monkeypatch):
+    _deliver(batch_deliveries, FakeSession(status_code=500), monkeypatch)
+
+    rows = WebhookDelivery.objects.all()
+    assert {(row.status, row.attempt_count, row.http_status, row.error_message) for row in rows} == {
+        ('failed', 1, 500, 'HTTP 500'),
+    }
+
+
+def test_batch_mode_marks_every_row_failed_on_exception(batch_deliveries, monkeypatch):
+    _deliver(batch_deliveries, FakeSession(exc=ConnectionError('connection refused')), monkeypatch)
+
+    rows = WebhookDelivery.objects.all()
+    assert {(row.status, row.attempt_count, row.error_message) for row in rows} == {
+        ('failed', 1, 'connection refused'),
+    }
+    assert WebhookEndpoint.objects.get().last_delivered_at is None
@@ -1,11 +1,14 @@
+import time
+
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from .models import WebhookEndpoint, WebhookDelivery
-from .serializers import WebhookEndpointSerializer, WebhookDeliverySerializer
+from .serializers import WebhookEndpointSerializer, WebhookDeliverySerializer, WebhookDeliveryListSerializer
 from .services import enqueue_event
-from .tasks import deliver_webhook_task
+from .tasks import queue_deliveries
+from tuutta_backend.auto_prefetch import only_fields
 
 
 class WebhookEndpointViewSet(viewsets.ModelViewSet):
@@ -30,10 +33,9 @@ class WebhookEndpointViewSet(viewsets.ModelViewSet):
 
         deliveries = enqueue_event(org_id, 'webhook.test', {
             'message': 'This is a signed test webhook from Tuutta.',
-            'sentAt': int(__import__('time').time() * 1000)
+            'sentAt': int(time.time() * 1000)
         })
-        for delivery in deliveries:
-            deliver_webhook_task.delay(str(delivery.id))
+        queue_deliveries(deliveries)
         return Response({'status': 'queued', 'deliveries': len(deliveries)})
 
 
@@ -41,11 +43,17 @@ class WebhookDeliveryViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = WebhookDeliverySerializer
 
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return WebhookDeliveryListSerializer
+        return WebhookDeliverySerializer
+
     def get_queryset(self):
+        queryset = WebhookDelivery.objects.only(*only_fields(self.get_serializer_class(), WebhookDelivery))
         org_id = self.kwargs.get('organization_pk') or self.request.query_params.get('organization')
         if org_id:
-            return WebhookDelivery.objects.filter(endpoint__organization_id=org_id)
+            return queryset.filter(endpoint__organization_id=org_id)
         endpoint_id = self.request.query_params.get('endpoint')
         if endpoint_id:
-            return WebhookDelivery.objects.filter(endpoint_id=endpoint_id)
+            return queryset.filter(endpoint_id=endpoint_id)
         return WebhookDelivery.objects.none()
@@ -8,6 +8,19 @@ Run tests with:
 """
 import os
 
+import pytest
+
 # Tell pytest-django which settings module to use.
 # The development settings use SQLite so tests run without any external DB.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tuutta_backend.settings.development")
+
+
+@pytest.fixture(autouse=True)
+def _fast_password_hasher(settings):
+    """
+    Swap the production PBKDF2 hasher for MD5 in tests.
+
+    Fixtures such as `org_admin`/`master_user` create users (and log them in)
+    for every test; PBKDF2 makes each of those ~100 ms, MD5 makes it ~1 ms.
+    """
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -0,0 +1,107 @@
+"""
+Derive `select_related`/`prefetch_related`/`only` lookups from a view's serializer.
+
+Serializer fields with dotted sources (`source='user.email'`) and nested
+serializers name the relations a response will touch; walking them against
+the model's `_meta` keeps the queryset's joins in step with the serializer
+instead of relying on hand-maintained lookups.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterator
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+
+
+def _attribute_paths(serializer: serializers.BaseSerializer, prefix: tuple[str, ...] = ()) -> Iterator[tuple[str, ...]]:
+    for field in serializer.fields.values():
+        if field.source == '*':
+            continue
+        path = prefix + tuple(field.source.split('.'))
+        if isinstance(field, serializers.ListSerializer):
+            yield path
+            yield from _attribute_paths(field.child, path)
+        elif isinstance(field, serializers.BaseSerializer):
+            yield path
+            yield from _attribute_paths(field, path)
+        elif len(path) > 1:
+            yield path[:-1]
+
+
+@lru_cache(maxsize=None)
+def related_lookups(
+    serializer_class: type[serializers.BaseSerializer],
+    model: type[models.Model],
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return `(select_related, prefetch_related)` lookups for `serializer_class` over `model`."""
+    select: set[str] = set()
+    prefetch: set[str] = set()
+    for path in _attribute_paths(serializer_class()):
+        relation_path: list[str] = []
+        many = False
+        current = model
+        for name in path:
+            try:
+                field = current._meta.get_field(name)
+            except FieldDoesNotExist:
+                break
+            if not field.is_relation or field.related_model is None:
+                break
+            relation_path.append(name)
+            many = many or field.many_to_many or field.one_to_many
+            current = field.related_model
+        if relation_path:
+            (prefetch if many else select).add('__'.join(relation_path))
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+@lru_cache(maxsize=None)
+def only_fields(
+    serializer_class: type[serializers.BaseSerializer],
+    model: type[models.Model],
+    extra: tuple[str, ...] = (),
+) -> tuple[str, ...]:
+    """
+    Return `.only()` lookups for the columns `serializer_class` reads from `model`.
+
+    `SerializerMethodField`s are opaque (`source='*'`), so whatever they touch
+    must be passed in `extra`. Nested serializers are left to prefetching.
+    """
+    lookups = {model._meta.pk.name, *extra}
+    for field in serializer_class().fields.values():
+        if field.source == '*' or isinstance(field, serializers.BaseSerializer):
+            continue
+        parts: list[str] = []
+        current = model
+        for name in field.source.split('.'):
+            try:
+                model_field = current._meta.get_field(name)
+            except FieldDoesNotExist:
+                parts = []
+                break
+            if model_field.many_to_many or model_field.one_to_many:
+                parts = []
+                break
+            parts.append(name)
+            if not model_field.is_relation:
+                break
+            current = model_field.related_model
+        if parts:
+            lookups.add('__'.join(parts))
+    return tuple(sorted(lookups))
+
+
+class AutoPrefetchMixin:
+    """Apply the serializer-derived related lookups to `get_queryset()`."""
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select, prefetch = related_lookups(self.get_serializer_class(), queryset.model)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
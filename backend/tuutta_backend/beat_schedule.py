@@ -0,0 +1,78 @@
+"""
+Celery beat schedule.
+
+Kept out of settings so that only the beat process imports `celery.schedules`
+and builds the crontab entries; settings point at `SCHEDULE` lazily.
+"""
+from celery.schedules import crontab
+
+# Heavy jobs sharing a morning get distinct minutes so they don't contend for
+# DB connections at the same instant.
+SCHEDULE = {
+    # The two outbox dispatchers share a 5-minute period on interleaved slots
+    # (:00/:05/... and :02/:07/...), so their runs never coincide.
+    'dispatch-notifications': {
+        'task': 'apps.notifications.tasks.dispatch_pending_notifications',
+        'schedule': crontab(minute='0-55/5'),
+    },
+    'dispatch-webhooks': {
+        'task': 'apps.webhooks.tasks.dispatch_pending_webhooks',
+        'schedule': crontab(minute='2-57/5'),
+    },
+    'deadline-reminders': {
+        'task': 'apps.enrollments.tasks.send_deadline_reminders',
+        'schedule': crontab(hour=9, minute=0),
+    },
+    'overdue-enrollments': {
+        'task': 'apps.enrollments.tasks.check_overdue_enrollments',
+        'schedule': crontab(hour=6, minute=0),
+    },
+    'archive-old-courses': {
+        'task': 'apps.courses.tasks.archive_old_courses',
+        'schedule': crontab(hour=3, minute=0, day_of_month=1),
+    },
+    'retention-policy': {
+        'task': 'apps.organizations.tasks.apply_retention_policies',
+        'schedule': crontab(hour=4, minute=0, day_of_month=1),
+    },
+    'competency-snapshots': {
+        'task': 'apps.competencies.tasks.refresh_competency_snapshots',
+        'schedule': crontab(hour=6, minute=15, day_of_week=1),
+    },
+    'analytics-refresh': {
+        'task': 'apps.analytics.tasks.analytics_refresh_scheduler',
+        'schedule': crontab(hour=7, minute=0, day_of_week=1),
+    },
+    'genie-report-scheduler': {
+        'task': 'apps.analytics.tasks.genie_report_scheduler',
+        'schedule': 86400.0,
+    },
+    'manager-digest-scheduler': {
+        'task': 'apps.analytics.tasks.manager_digest_scheduler',
+        'schedule': crontab(hour=7, minute=30, day_of_week=1),
+    },
+    'manager-digest-processor': {
+        'task': 'apps.analytics.tasks.process_manager_digests_task',
+        'schedule': 3600.0,
+    },
+    'failure-risk-refresh': {
+        'task': 'apps.learning_intelligence.tasks.compute_failure_risk_task',
+        'schedule': crontab(hour=5, minute=0),
+        'args': (),
+    },
+    'adaptive-recommendations-refresh': {
+        'task': 'apps.learning_intelligence.tasks.generate_adaptive_recommendations_task',
+        'schedule': crontab(hour=5, minute=30),
+        'args': (),
+    },
+    'org-forecasting-refresh': {
+        'task': 'apps.analytics.tasks.compute_org_forecasting_task',
+        'schedule': crontab(hour=6, minute=45, day_of_week=1),
+        'args': (),
+    },
+    'adaptive-policy-optimization': {
+        'task': 'apps.learning_intelligence.tasks.optimize_adaptive_policy_task',
+        'schedule': crontab(hour=6, minute=30, day_of_week=1),
+        'args': (),
+    },
+}
@@ -0,0 +1,33 @@
+"""
+CORS middleware with a precomputed origin allow-list.
+
+django-cors-headers re-parses every `CORS_ALLOWED_ORIGINS` entry with
+`urlsplit()` on each request and scans the results; the parsed
+`(scheme, netloc)` pairs are kept in a frozenset here instead, so the check is
+a single hash lookup.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import SplitResult, urlsplit
+
+from corsheaders.conf import conf
+from corsheaders.middleware import CorsMiddleware as BaseCorsMiddleware
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+@lru_cache(maxsize=None)
+def allowed_origins() -> frozenset[tuple[str, str]]:
+    return frozenset((url.scheme, url.netloc) for url in map(urlsplit, conf.CORS_ALLOWED_ORIGINS))
+
+
+@receiver(setting_changed)
+def _reset_allowed_origins(*, setting: str, **kwargs) -> None:
+    if setting == 'CORS_ALLOWED_ORIGINS':
+        allowed_origins.cache_clear()
+
+
+class CorsMiddleware(BaseCorsMiddleware):
+    def _url_in_whitelist(self, url: SplitResult) -> bool:
+        return (url.scheme, url.netloc) in allowed_origins()
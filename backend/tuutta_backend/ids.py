@@ -0,0 +1,22 @@
+"""
+Time-ordered primary key generation.
+
+`uuid.uuid4` keys land at random points in a B-tree, so high-insert tables
+fragment their primary key index. UUIDv7 (RFC 9562) leads with a millisecond
+Unix timestamp, which keeps inserts append-mostly while staying a plain
+`uuid.UUID` for existing columns and foreign keys.
+"""
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return a UUIDv7: 48-bit ms timestamp, version/variant bits, 74 random bits."""
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), 'big')
+    value &= ~(0xF << 76) & ~(0x3 << 62)
+    value |= (0x7 << 76) | (0x2 << 62)
+    return uuid.UUID(int=value)
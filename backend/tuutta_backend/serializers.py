@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from rest_framework import serializers
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class.
+
+    `ModelSerializer.get_fields()` re-runs model introspection and
+    `build_field()` for every serializer instance, although the result only
+    depends on the class. Build it once and hand each instance a deep copy,
+    which is what DRF already does for declared fields.
+    """
+
+    def get_fields(self) -> dict[str, Any]:
+        cls = type(self)
+        template = cls.__dict__.get('_cached_field_definitions')
+        if template is None:
+            template = super().get_fields()
+            cls._cached_field_definitions = template
+        return copy.deepcopy(template)
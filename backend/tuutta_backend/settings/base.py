@@ -4,30 +4,37 @@ Base Django settings for tuutta_backend project.
 import os
 from pathlib import Path
 from datetime import timedelta
-from celery.schedules import crontab
+
+from django.utils.functional import SimpleLazyObject
+from django.utils.module_loading import import_string
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# Refresh-token blacklisting (on by default). Processes that never issue or
+# revoke tokens, such as Celery workers, can set JWT_BLACKLIST=0 to skip the
+# token_blacklist app.
+JWT_BLACKLIST_ENABLED = os.environ.get('JWT_BLACKLIST', '1') == '1'
+
 # Application definition
-DJANGO_APPS = [
+DJANGO_APPS = (
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-]
+)
 
-THIRD_PARTY_APPS = [
+THIRD_PARTY_APPS = (
     'rest_framework',
     'rest_framework_simplejwt',
-    'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
     'drf_spectacular',
-    'storages',
-]
+)
+if JWT_BLACKLIST_ENABLED:
+    THIRD_PARTY_APPS += ('rest_framework_simplejwt.token_blacklist',)
 
-LOCAL_APPS = [
+LOCAL_APPS = (
     'apps.accounts',
     'apps.organizations',
     'apps.courses',
@@ -46,14 +53,14 @@ LOCAL_APPS = [
     'apps.knowledge',
     'apps.learning_intelligence',
     'apps.governance',
-]
+)
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
-    'corsheaders.middleware.CorsMiddleware',
+    'tuutta_backend.cors.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -61,7 +68,7 @@ MIDDLEWARE = [
     'apps.organizations.middleware.OrgSlugResolutionMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-]
+)
 
 ROOT_URLCONF = 'tuutta_backend.urls'
 
@@ -87,12 +94,12 @@ ASGI_APPLICATION = 'tuutta_backend.asgi.application'
 # Auth
 AUTH_USER_MODEL = 'accounts.User'
 
-AUTH_PASSWORD_VALIDATORS = [
+AUTH_PASSWORD_VALIDATORS = (
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
     {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
-]
+)
 
 # Internationalization
 LANGUAGE_CODE = 'en-us'
@@ -141,80 +148,16 @@ REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'tuutta_backend.api_errors.api_exception_handler',
 }
 
-# Celery beat schedules
-CELERY_BEAT_SCHEDULE = {
-    'dispatch-notifications': {
-        'task': 'apps.notifications.tasks.dispatch_pending_notifications',
-        'schedule': 300.0,
-    },
-    'dispatch-webhooks': {
-        'task': 'apps.webhooks.tasks.dispatch_pending_webhooks',
-        'schedule': 300.0,
-    },
-    'deadline-reminders': {
-        'task': 'apps.enrollments.tasks.send_deadline_reminders',
-        'schedule': crontab(hour=9, minute=0),
-    },
-    'overdue-enrollments': {
-        'task': 'apps.enrollments.tasks.check_overdue_enrollments',
-        'schedule': crontab(hour=6, minute=0),
-    },
-    'archive-old-courses': {
-        'task': 'apps.courses.tasks.archive_old_courses',
-        'schedule': crontab(hour=3, minute=0, day_of_month=1),
-    },
-    'retention-policy': {
-        'task': 'apps.organizations.tasks.apply_retention_policies',
-        'schedule': crontab(hour=4, minute=0, day_of_month=1),
-    },
-    'competency-snapshots': {
-        'task': 'apps.competencies.tasks.refresh_competency_snapshots',
-        'schedule': crontab(hour=6, minute=0, day_of_week=1),
-    },
-    'analytics-refresh': {
-        'task': 'apps.analytics.tasks.analytics_refresh_scheduler',
-        'schedule': crontab(hour=7, minute=0, day_of_week=1),
-    },
-    'genie-report-scheduler': {
-        'task': 'apps.analytics.tasks.genie_report_scheduler',
-        'schedule': 86400.0,
-    },
-    'manager-digest-scheduler': {
-        'task': 'apps.analytics.tasks.manager_digest_scheduler',
-        'schedule': crontab(hour=7, minute=0, day_of_week=1),
-    },
-    'manager-digest-processor': {
-        'task': 'apps.analytics.tasks.process_manager_digests_task',
-        'schedule': 3600.0,
-    },
-    'failure-risk-refresh': {
-        'task': 'apps.learning_intelligence.tasks.compute_failure_risk_task',
-        'schedule': crontab(hour=5, minute=0),
-        'args': (),
-    },
-    'adaptive-recommendations-refresh': {
-        'task': 'apps.learning_intelligence.tasks.generate_adaptive_recommendations_task',
-        'schedule': crontab(hour=5, minute=30),
-        'args': (),
-    },
-    'org-forecasting-refresh': {
-        'task': 'apps.analytics.tasks.compute_org_forecasting_task',
-        'schedule': crontab(hour=6, minute=0, day_of_week=1),
-        'args': (),
-    },
-    'adaptive-policy-optimization': {
-        'task': 'apps.learning_intelligence.tasks.optimize_adaptive_policy_task',
-        'schedule': crontab(hour=6, minute=30, day_of_week=1),
-        'args': (),
-    },
-}
+# Celery beat schedules (see tuutta_backend/beat_schedule.py; loaded on first
+# access, which only the beat scheduler makes)
+CELERY_BEAT_SCHEDULE = SimpleLazyObject(lambda: import_string('tuutta_backend.beat_schedule.SCHEDULE'))
 
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
-    'BLACKLIST_AFTER_ROTATION': True,
+    'BLACKLIST_AFTER_ROTATION': JWT_BLACKLIST_ENABLED,
     'UPDATE_LAST_LOGIN': True,
     'ALGORITHM': 'HS256',
     'AUTH_HEADER_TYPES': ('Bearer',),
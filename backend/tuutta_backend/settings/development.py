@@ -5,7 +5,11 @@ import os
 from .base import *
 from dotenv import load_dotenv
 
-load_dotenv(BASE_DIR.parent / '.env')
+# Child processes (runserver's reloader, test workers) inherit the parent's
+# environment, which already holds the .env values, so parse the file once.
+if 'TUUTTA_DOTENV_LOADED' not in os.environ:
+    load_dotenv(BASE_DIR.parent / '.env')
+    os.environ['TUUTTA_DOTENV_LOADED'] = '1'
 
 SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production-abc123xyz')
 DEBUG = True
@@ -20,14 +24,23 @@ DATABASES = {
     }
 }
 
-# Redis (use dummy cache if Redis not available locally)
+# Redis (use a local-memory cache if Redis is not configured)
 REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+if os.environ.get('REDIS_URL'):
+    # Shared across runserver/gunicorn workers and Celery, as in production.
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
     }
-}
 
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
@@ -38,9 +51,6 @@ CORS_ALLOW_ALL_ORIGINS = True
 # Email (console backend for dev)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
-# Static/Media
-MEDIA_ROOT = BASE_DIR / 'media'
-
 # OpenAI
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 
@@ -2,24 +2,30 @@
 Production Django settings for Render.com deployment.
 """
 import os
+import re
 import dj_database_url
 from .base import *
 
-SECRET_KEY = os.environ.get('SECRET_KEY')
+_env = os.environ.get
+
+SECRET_KEY = _env('SECRET_KEY')
 DEBUG = False
-ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '').split(',')
+ALLOWED_HOSTS = _env('ALLOWED_HOSTS', '').split(',')
 
 # Database - Render provides DATABASE_URL
+# Health checks cost a SELECT 1 whenever a request picks up a persistent
+# connection; web requests are short enough to skip them, while long-lived
+# worker processes keep them to recover from dropped connections.
 DATABASES = {
     'default': dj_database_url.config(
-        default=os.environ.get('DATABASE_URL'),
+        default=_env('DATABASE_URL'),
         conn_max_age=600,
-        conn_health_checks=True,
+        conn_health_checks=_env('DJANGO_PROCESS_TYPE') != 'web',
     )
 }
 
 # Redis Cache & Celery (optional — falls back to local-mem cache if not configured)
-REDIS_URL = os.environ.get('REDIS_URL', '')
+REDIS_URL = _env('REDIS_URL', '')
 
 if REDIS_URL:
     CACHES = {
@@ -30,6 +36,9 @@ if REDIS_URL:
     }
     CELERY_BROKER_URL = REDIS_URL
     CELERY_RESULT_BACKEND = REDIS_URL
+    # Beat keeps due times in a Redis sorted set instead of a local shelve file.
+    CELERY_BEAT_SCHEDULER = 'redbeat.RedBeatScheduler'
+    CELERY_REDBEAT_REDIS_URL = REDIS_URL
 else:
     CACHES = {
         'default': {
@@ -38,12 +47,23 @@ else:
     }
 
 # CORS
+_ORIGIN_RE = re.compile(r'[^,\s]+')
+
+
 def _parse_origin_csv(value: str) -> list[str]:
-    return [
-        item.strip().rstrip('/')
-        for item in (value or '').split(',')
-        if item.strip()
-    ]
+    return [origin.rstrip('/') for origin in _ORIGIN_RE.findall(value or '')]
+
+
+def _dedup(*iterables) -> list[str]:
+    """Concatenate `iterables`, keeping the first occurrence of each origin."""
+    seen = set()
+    origins = []
+    for iterable in iterables:
+        for origin in iterable:
+            if origin not in seen:
+                seen.add(origin)
+                origins.append(origin)
+    return origins
 
 
 default_cors_origins = [
@@ -54,13 +74,18 @@ default_cors_origins = [
     'http://127.0.0.1:5173',
 ]
 
-env_cors_origins = _parse_origin_csv(os.environ.get('CORS_ALLOWED_ORIGINS', ''))
-frontend_origin = os.environ.get('FRONTEND_URL', '').strip().rstrip('/')
+env_cors_raw = _env('CORS_ALLOWED_ORIGINS')
+env_cors_origins = _parse_origin_csv(env_cors_raw) if env_cors_raw else []
+frontend_origin = _env('FRONTEND_URL', '').strip().rstrip('/')
 if frontend_origin:
     env_cors_origins.append(frontend_origin)
 
-CORS_ALLOWED_ORIGINS = list(dict.fromkeys(env_cors_origins + default_cors_origins))
-CSRF_TRUSTED_ORIGINS = list(dict.fromkeys(_parse_origin_csv(os.environ.get('CSRF_TRUSTED_ORIGINS', '')) + CORS_ALLOWED_ORIGINS))
+# The defaults are already unique, so they need no dedup pass on their own.
+CORS_ALLOWED_ORIGINS = _dedup(env_cors_origins, default_cors_origins) if env_cors_origins else default_cors_origins
+csrf_env_raw = _env('CSRF_TRUSTED_ORIGINS')
+CSRF_TRUSTED_ORIGINS = (
+    _dedup(_parse_origin_csv(csrf_env_raw), CORS_ALLOWED_ORIGINS) if csrf_env_raw else list(CORS_ALLOWED_ORIGINS)
+)
 
 # Security Headers
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
@@ -72,31 +97,32 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 
 # File Storage - Cloudflare R2 (S3-compatible), only active when credentials are set
-AWS_ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID', '')
-AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY', '')
-AWS_STORAGE_BUCKET_NAME = os.environ.get('AWS_STORAGE_BUCKET_NAME', '')
-AWS_S3_ENDPOINT_URL = os.environ.get('AWS_S3_ENDPOINT_URL', '')
+AWS_ACCESS_KEY_ID = _env('AWS_ACCESS_KEY_ID', '')
+AWS_SECRET_ACCESS_KEY = _env('AWS_SECRET_ACCESS_KEY', '')
+AWS_STORAGE_BUCKET_NAME = _env('AWS_STORAGE_BUCKET_NAME', '')
+AWS_S3_ENDPOINT_URL = _env('AWS_S3_ENDPOINT_URL', '')
 AWS_S3_REGION_NAME = 'auto'
 AWS_DEFAULT_ACL = None
 AWS_S3_OBJECT_PARAMETERS = {'CacheControl': 'max-age=86400'}
 
 if AWS_ACCESS_KEY_ID and AWS_STORAGE_BUCKET_NAME:
+    INSTALLED_APPS = INSTALLED_APPS + ('storages',)
     STORAGES = {
         "default": {"BACKEND": "storages.backends.s3boto3.S3Boto3Storage"},
         "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
     }
 
 # OpenAI
-OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
+OPENAI_API_KEY = _env('OPENAI_API_KEY', '')
 
 # Email (configure SendGrid or similar for production)
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-EMAIL_HOST = os.environ.get('EMAIL_HOST', '')
-EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 587))
-EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
-EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_HOST = _env('EMAIL_HOST', '')
+EMAIL_PORT = int(_env('EMAIL_PORT', 587))
+EMAIL_HOST_USER = _env('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = _env('EMAIL_HOST_PASSWORD', '')
 EMAIL_USE_TLS = True
-DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@tuutta.com')
+DEFAULT_FROM_EMAIL = _env('DEFAULT_FROM_EMAIL', 'noreply@tuutta.com')
 
 # Logging
 LOGGING = {
@@ -1,9 +1,10 @@
 from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers as nested_routers
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from rest_framework_simplejwt.views import TokenRefreshView
 
 from apps.accounts.views import (
     RegisterView,
@@ -90,138 +91,185 @@ def health_check(request):
     return JsonResponse({'status': 'ok'})
 
 
+def spectacular_view(name, **initkwargs):
+    """Import drf_spectacular's schema generator on the first docs request, not at URLconf load."""
+    view = None
+
+    @csrf_exempt
+    def lazy_view(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            from drf_spectacular import views
+
+            view = getattr(views, name).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    return lazy_view
+
+
+# (prefix, viewset, basename) for each router, registered in one loop per router
+ROUTES = (
+    (r'organizations', OrganizationViewSet, 'organization'),
+    (r'organization-requests', OrganizationRequestViewSet, 'organization-request'),
+    (r'courses', CourseViewSet, 'course'),
+    (r'assessments', AssessmentViewSet, 'assessment'),
+    (r'enrollments', EnrollmentViewSet, 'enrollment'),
+    (r'achievements', AchievementViewSet, 'achievement'),
+    (r'progress', ProgressViewSet, 'progress'),
+    (r'certificates', CertificateViewSet, 'certificate'),
+    (r'certificate-templates', CertificateTemplateViewSet, 'certificate-templates'),
+    (r'notifications', NotificationViewSet, 'notification'),
+    (r'bloom-levels', BloomLevelViewSet, 'bloom-levels'),
+)
+
+COURSE_ROUTES = (
+    (r'modules', CourseModuleViewSet, 'course-modules'),
+    (r'adaptive-release-rules', AdaptiveReleaseRuleViewSet, 'course-adaptive-release-rules'),
+)
+
+MODULE_ROUTES = (
+    (r'lessons', LessonViewSet, 'module-lessons'),
+)
+
+ASSESSMENT_ROUTES = (
+    (r'questions', QuestionViewSet, 'assessment-questions'),
+)
+
+ORG_ROUTES = (
+    (r'departments', DepartmentViewSet, 'organization-departments'),
+    (r'teams', TeamViewSet, 'organization-teams'),
+    (r'members', OrganizationMemberViewSet, 'organization-members'),
+    (r'join-requests', OrganizationJoinRequestViewSet, 'organization-join-requests'),
+    (r'invite-codes', OrganizationInviteCodeViewSet, 'organization-invite-codes'),
+    (r'learning-paths', LearningPathViewSet, 'organization-learning-paths'),
+    # Cognitive OS nested routes
+    (r'competency-frameworks', CompetencyFrameworkViewSet, 'organization-competency-frameworks'),
+    (r'competencies', CompetencyViewSet, 'organization-competencies'),
+    (r'role-competency-mappings', RoleCompetencyMappingViewSet, 'organization-role-mappings'),
+    (r'compliance-policies', CompliancePolicyViewSet, 'organization-compliance-policies'),
+    (r'competency-scores', CompetencyScoreViewSet, 'organization-competency-scores'),
+    (r'competency-snapshots', CompetencySnapshotViewSet, 'organization-competency-snapshots'),
+    (r'knowledge-documents', KnowledgeDocumentViewSet, 'organization-knowledge-documents'),
+    (r'knowledge-chunks', KnowledgeChunkViewSet, 'organization-knowledge-chunks'),
+    (r'knowledge-nodes', KnowledgeNodeViewSet, 'organization-knowledge-nodes'),
+    (r'knowledge-edges', KnowledgeEdgeViewSet, 'organization-knowledge-edges'),
+    (r'cognitive-profiles', CognitiveProfileViewSet, 'organization-cognitive-profiles'),
+    (r'gap-matrix', GapMatrixViewSet, 'organization-gap-matrix'),
+    (r'remediation-triggers', RemediationTriggerViewSet, 'organization-remediation-triggers'),
+    (r'remediation-assignments', RemediationAssignmentViewSet, 'organization-remediation-assignments'),
+    (r'adaptive-policies', AdaptivePolicyViewSet, 'organization-adaptive-policies'),
+    (r'adaptive-recommendations', AdaptiveRecommendationViewSet, 'organization-adaptive-recommendations'),
+    (r'adaptive-decisions', AdaptiveDecisionLogViewSet, 'organization-adaptive-decisions'),
+    (r'failure-risks', FailureRiskSnapshotViewSet, 'organization-failure-risks'),
+    (r'baseline-diagnostics', BaselineDiagnosticViewSet, 'organization-baseline-diagnostics'),
+    (r'gnn-insights', GNNInsightViewSet, 'organization-gnn-insights'),
+    (r'intervention-logs', InterventionLogViewSet, 'organization-intervention-logs'),
+    (r'gap-closure-snapshots', GapClosureSnapshotViewSet, 'organization-gap-closure-snapshots'),
+    (r'notifications', NotificationViewSet, 'organization-notifications'),
+    (r'notification-outbox', NotificationOutboxViewSet, 'organization-notification-outbox'),
+    (r'webhook-endpoints', WebhookEndpointViewSet, 'organization-webhook-endpoints'),
+    (r'webhook-deliveries', WebhookDeliveryViewSet, 'organization-webhook-deliveries'),
+    (r'audit-logs', AuditLogViewSet, 'organization-audit-logs'),
+    (r'analytics-jobs', AnalyticsJobViewSet, 'organization-analytics-jobs'),
+    (r'bloom-analytics', BloomAnalyticsSnapshotViewSet, 'organization-bloom-analytics'),
+    (r'workforce-capability', WorkforceCapabilityIndexViewSet, 'organization-workforce-capability'),
+    (r'department-bloom-trends', DepartmentBloomTrendViewSet, 'organization-department-bloom-trends'),
+    (r'competency-forecasts', CompetencyTrajectoryForecastViewSet, 'organization-competency-forecasts'),
+    (r'compliance-readiness', ComplianceReadinessPredictionViewSet, 'organization-compliance-readiness'),
+    (r'skill-shortages', StrategicSkillShortageDetectionViewSet, 'organization-skill-shortages'),
+    (r'genie-report-schedules', GenieReportScheduleViewSet, 'organization-genie-report-schedules'),
+    (r'genie-report-runs', GenieReportRunViewSet, 'organization-genie-report-runs'),
+    (r'manager-digest-runs', ManagerDigestRunViewSet, 'organization-manager-digest-runs'),
+    # Governance
+    (r'governance-policies', GovernancePolicyViewSet, 'organization-governance-policies'),
+    (r'explainability-logs', ExplainabilityLogViewSet, 'organization-explainability-logs'),
+    (r'bias-scans', BiasScanViewSet, 'organization-bias-scans'),
+    (r'model-versions', ModelVersionViewSet, 'organization-model-versions'),
+    (r'human-overrides', HumanOverrideViewSet, 'organization-human-overrides'),
+    # ELS Pipeline routes
+    (r'els-projects', ELSProjectViewSet, 'organization-els-projects'),
+)
+
+LEARNING_PATH_ROUTES = (
+    (r'courses', LearningPathCourseViewSet, 'learning-path-courses'),
+)
+
+
+def register_routes(target, routes):
+    for prefix, viewset, basename in routes:
+        target.register(prefix, viewset, basename=basename)
+
+
 # Main router
 router = DefaultRouter()
-router.register(r'organizations', OrganizationViewSet, basename='organization')
-router.register(r'organization-requests', OrganizationRequestViewSet, basename='organization-request')
-router.register(r'courses', CourseViewSet, basename='course')
-router.register(r'assessments', AssessmentViewSet, basename='assessment')
-router.register(r'enrollments', EnrollmentViewSet, basename='enrollment')
-router.register(r'achievements', AchievementViewSet, basename='achievement')
-router.register(r'progress', ProgressViewSet, basename='progress')
-router.register(r'certificates', CertificateViewSet, basename='certificate')
-router.register(r'certificate-templates', CertificateTemplateViewSet, basename='certificate-templates')
-router.register(r'notifications', NotificationViewSet, basename='notification')
+register_routes(router, ROUTES)
 
 # Nested routers
 courses_router = nested_routers.NestedDefaultRouter(router, r'courses', lookup='course')
-courses_router.register(r'modules', CourseModuleViewSet, basename='course-modules')
-courses_router.register(r'adaptive-release-rules', AdaptiveReleaseRuleViewSet, basename='course-adaptive-release-rules')
+register_routes(courses_router, COURSE_ROUTES)
 
 modules_router = nested_routers.NestedDefaultRouter(courses_router, r'modules', lookup='module')
-modules_router.register(r'lessons', LessonViewSet, basename='module-lessons')
+register_routes(modules_router, MODULE_ROUTES)
 
 assessments_router = nested_routers.NestedDefaultRouter(router, r'assessments', lookup='assessment')
-assessments_router.register(r'questions', QuestionViewSet, basename='assessment-questions')
+register_routes(assessments_router, ASSESSMENT_ROUTES)
 
 orgs_router = nested_routers.NestedDefaultRouter(router, r'organizations', lookup='organization')
-orgs_router.register(r'departments', DepartmentViewSet, basename='organization-departments')
-orgs_router.register(r'teams', TeamViewSet, basename='organization-teams')
-orgs_router.register(r'members', OrganizationMemberViewSet, basename='organization-members')
-orgs_router.register(r'join-requests', OrganizationJoinRequestViewSet, basename='organization-join-requests')
-orgs_router.register(r'invite-codes', OrganizationInviteCodeViewSet, basename='organization-invite-codes')
-orgs_router.register(r'learning-paths', LearningPathViewSet, basename='organization-learning-paths')
-# Cognitive OS nested routes
-orgs_router.register(r'competency-frameworks', CompetencyFrameworkViewSet, basename='organization-competency-frameworks')
-orgs_router.register(r'competencies', CompetencyViewSet, basename='organization-competencies')
-orgs_router.register(r'role-competency-mappings', RoleCompetencyMappingViewSet, basename='organization-role-mappings')
-orgs_router.register(r'compliance-policies', CompliancePolicyViewSet, basename='organization-compliance-policies')
-orgs_router.register(r'competency-scores', CompetencyScoreViewSet, basename='organization-competency-scores')
-orgs_router.register(r'competency-snapshots', CompetencySnapshotViewSet, basename='organization-competency-snapshots')
-router.register(r'bloom-levels', BloomLevelViewSet, basename='bloom-levels')
-orgs_router.register(r'knowledge-documents', KnowledgeDocumentViewSet, basename='organization-knowledge-documents')
-orgs_router.register(r'knowledge-chunks', KnowledgeChunkViewSet, basename='organization-knowledge-chunks')
-orgs_router.register(r'knowledge-nodes', KnowledgeNodeViewSet, basename='organization-knowledge-nodes')
-orgs_router.register(r'knowledge-edges', KnowledgeEdgeViewSet, basename='organization-knowledge-edges')
-orgs_router.register(r'cognitive-profiles', CognitiveProfileViewSet, basename='organization-cognitive-profiles')
-orgs_router.register(r'gap-matrix', GapMatrixViewSet, basename='organization-gap-matrix')
-orgs_router.register(r'remediation-triggers', RemediationTriggerViewSet, basename='organization-remediation-triggers')
-orgs_router.register(r'remediation-assignments', RemediationAssignmentViewSet, basename='organization-remediation-assignments')
-orgs_router.register(r'adaptive-policies', AdaptivePolicyViewSet, basename='organization-adaptive-policies')
-orgs_router.register(r'adaptive-recommendations', AdaptiveRecommendationViewSet, basename='organization-adaptive-recommendations')
-orgs_router.register(r'adaptive-decisions', AdaptiveDecisionLogViewSet, basename='organization-adaptive-decisions')
-orgs_router.register(r'failure-risks', FailureRiskSnapshotViewSet, basename='organization-failure-risks')
-orgs_router.register(r'baseline-diagnostics', BaselineDiagnosticViewSet, basename='organization-baseline-diagnostics')
-orgs_router.register(r'gnn-insights', GNNInsightViewSet, basename='organization-gnn-insights')
-orgs_router.register(r'intervention-logs', InterventionLogViewSet, basename='organization-intervention-logs')
-orgs_router.register(r'gap-closure-snapshots', GapClosureSnapshotViewSet, basename='organization-gap-closure-snapshots')
-orgs_router.register(r'notifications', NotificationViewSet, basename='organization-notifications')
-orgs_router.register(r'notification-outbox', NotificationOutboxViewSet, basename='organization-notification-outbox')
-orgs_router.register(r'webhook-endpoints', WebhookEndpointViewSet, basename='organization-webhook-endpoints')
-orgs_router.register(r'webhook-deliveries', WebhookDeliveryViewSet, basename='organization-webhook-deliveries')
-orgs_router.register(r'audit-logs', AuditLogViewSet, basename='organization-audit-logs')
-orgs_router.register(r'analytics-jobs', AnalyticsJobViewSet, basename='organization-analytics-jobs')
-orgs_router.register(r'bloom-analytics', BloomAnalyticsSnapshotViewSet, basename='organization-bloom-analytics')
-orgs_router.register(r'workforce-capability', WorkforceCapabilityIndexViewSet, basename='organization-workforce-capability')
-orgs_router.register(r'department-bloom-trends', DepartmentBloomTrendViewSet, basename='organization-department-bloom-trends')
-orgs_router.register(r'competency-forecasts', CompetencyTrajectoryForecastViewSet, basename='organization-competency-forecasts')
-orgs_router.register(r'compliance-readiness', ComplianceReadinessPredictionViewSet, basename='organization-compliance-readiness')
-orgs_router.register(r'skill-shortages', StrategicSkillShortageDetectionViewSet, basename='organization-skill-shortages')
-orgs_router.register(r'genie-report-schedules', GenieReportScheduleViewSet, basename='organization-genie-report-schedules')
-orgs_router.register(r'genie-report-runs', GenieReportRunViewSet, basename='organization-genie-report-runs')
-orgs_router.register(r'manager-digest-runs', ManagerDigestRunViewSet, basename='organization-manager-digest-runs')
-# Governance
-orgs_router.register(r'governance-policies', GovernancePolicyViewSet, basename='organization-governance-policies')
-orgs_router.register(r'explainability-logs', ExplainabilityLogViewSet, basename='organization-explainability-logs')
-orgs_router.register(r'bias-scans', BiasScanViewSet, basename='organization-bias-scans')
-orgs_router.register(r'model-versions', ModelVersionViewSet, basename='organization-model-versions')
-orgs_router.register(r'human-overrides', HumanOverrideViewSet, basename='organization-human-overrides')
-# ELS Pipeline routes
-orgs_router.register(r'els-projects', ELSProjectViewSet, basename='organization-els-projects')
+register_routes(orgs_router, ORG_ROUTES)
 
 learning_paths_router = nested_routers.NestedDefaultRouter(orgs_router, r'learning-paths', lookup='learning_path')
-learning_paths_router.register(r'courses', LearningPathCourseViewSet, basename='learning-path-courses')
+register_routes(learning_paths_router, LEARNING_PATH_ROUTES)
+
+API_V1_PATTERNS = [
+    # Auth
+    path('auth/register/', RegisterView.as_view(), name='register'),
+    path('auth/login/', LoginView.as_view(), name='login'),
+    path('auth/logout/', LogoutView.as_view(), name='logout'),
+    path('auth/token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
+    path('auth/me/', CurrentUserView.as_view(), name='current-user'),
+    path('auth/onboarding/', OnboardingStateView.as_view(), name='onboarding-state'),
+    path('workspaces/resolve/', WorkspaceResolverView.as_view(), name='workspace-resolver'),
+    path('master/users/', MasterUsersView.as_view(), name='master-users'),
+
+    # Memberships
+    path('members/me/', MyMembershipsView.as_view(), name='my-memberships'),
+    path('members/<uuid:pk>/', MemberDetailView.as_view(), name='member-detail'),
+    path('invite-codes/redeem/', InviteCodeRedeemView.as_view(), name='invite-code-redeem'),
+
+    # Main routes
+    path('', include(router.urls)),
+    path('', include(courses_router.urls)),
+    path('', include(modules_router.urls)),
+    path('', include(assessments_router.urls)),
+    path('', include(orgs_router.urls)),
+    path('', include(learning_paths_router.urls)),
+
+    # Genie / ELS
+    path('genie/', include('apps.genie.urls')),
+
+    # AI Services
+    path('ai/chat/', ChatCompletionView.as_view(), name='ai-chat'),
+    path('ai/transcribe/', TranscribeView.as_view(), name='ai-transcribe'),
+    path('ai/tts/', TextToSpeechView.as_view(), name='ai-tts'),
+    path('ai/search/', WebSearchView.as_view(), name='ai-search'),
+
+    # Evidence export
+    path('organizations/<str:org_id>/evidence-export/', EvidenceExportView.as_view(), name='evidence-export'),
+    path('master/reports/summary/', MasterReportSummaryView.as_view(), name='master-report-summary'),
+    path('master/governance/audit/', MasterGovernanceAuditView.as_view(), name='master-governance-audit'),
+
+    # Gamification
+    path('leaderboard/', LeaderboardView.as_view(), name='leaderboard'),
+
+    # Health check
+    path('health/', health_check, name='health-check'),
+
+    # API Schema
+    path('schema/', spectacular_view('SpectacularAPIView'), name='schema'),
+    path('docs/', spectacular_view('SpectacularSwaggerView', url_name='schema'), name='swagger-ui'),
+]
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-
-    # API v1
-    path('api/v1/', include([
-        # Auth
-        path('auth/register/', RegisterView.as_view(), name='register'),
-        path('auth/login/', LoginView.as_view(), name='login'),
-        path('auth/logout/', LogoutView.as_view(), name='logout'),
-        path('auth/token/refresh/', __import__('rest_framework_simplejwt.views', fromlist=['TokenRefreshView']).TokenRefreshView.as_view(), name='token-refresh'),
-        path('auth/me/', CurrentUserView.as_view(), name='current-user'),
-        path('auth/onboarding/', OnboardingStateView.as_view(), name='onboarding-state'),
-        path('workspaces/resolve/', WorkspaceResolverView.as_view(), name='workspace-resolver'),
-        path('master/users/', MasterUsersView.as_view(), name='master-users'),
-
-        # Memberships
-        path('members/me/', MyMembershipsView.as_view(), name='my-memberships'),
-        path('members/<uuid:pk>/', MemberDetailView.as_view(), name='member-detail'),
-        path('invite-codes/redeem/', InviteCodeRedeemView.as_view(), name='invite-code-redeem'),
-
-        # Main routes
-        path('', include(router.urls)),
-        path('', include(courses_router.urls)),
-        path('', include(modules_router.urls)),
-        path('', include(assessments_router.urls)),
-        path('', include(orgs_router.urls)),
-        path('', include(learning_paths_router.urls)),
-
-        # Genie / ELS
-        path('genie/', include('apps.genie.urls')),
-
-        # AI Services
-        path('ai/chat/', ChatCompletionView.as_view(), name='ai-chat'),
-        path('ai/transcribe/', TranscribeView.as_view(), name='ai-transcribe'),
-        path('ai/tts/', TextToSpeechView.as_view(), name='ai-tts'),
-        path('ai/search/', WebSearchView.as_view(), name='ai-search'),
-
-        # Evidence export
-        path('organizations/<str:org_id>/evidence-export/', EvidenceExportView.as_view(), name='evidence-export'),
-        path('master/reports/summary/', MasterReportSummaryView.as_view(), name='master-report-summary'),
-        path('master/governance/audit/', MasterGovernanceAuditView.as_view(), name='master-governance-audit'),
-
-        # Gamification
-        path('leaderboard/', LeaderboardView.as_view(), name='leaderboard'),
-
-        # Health check
-        path('health/', health_check, name='health-check'),
-
-        # API Schema
-        path('schema/', SpectacularAPIView.as_view(), name='schema'),
-        path('docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    ])),
+    path('api/v1/', include(API_V1_PATTERNS)),
 ]